@@ -0,0 +1,80 @@
+// Clientside callbacks: rendered in the browser from data it already holds,
+// so these outputs never cost a server round trip.
+(function () {
+    var amountFormat = new Intl.NumberFormat("en-US", {minimumFractionDigits: 2, maximumFractionDigits: 2});
+
+    // Same text as Python's f"₹{value:,.2f}"
+    function rupees(value) {
+        return "₹" + amountFormat.format(value);
+    }
+
+    function options(store, column) {
+        return (store.options[column] || []).map(function (value) {
+            return {label: value, value: value};
+        });
+    }
+
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        dashboard: {
+            // Month/Category dropdown options and table columns from a data store
+            filterOutputs: function (store) {
+                if (!store) {
+                    return [[], [], []];
+                }
+                var columns = (store.columns || []).map(function (name) {
+                    return {name: name, id: name};
+                });
+                return [options(store, "Month"), options(store, "Category"), columns];
+            },
+
+            // Reset button: clear both filter dropdowns, unless they already are
+            resetFilters: function (nClicks, months, categories) {
+                if (!nClicks || (!(months && months.length) && !(categories && categories.length))) {
+                    return [window.dash_clientside.no_update, window.dash_clientside.no_update];
+                }
+                return [[], []];
+            },
+
+            // Total, average, highest and lowest KPIs (overview and investments pages)
+            amountKpis: function (kpis) {
+                if (!kpis) {
+                    return ["₹0.00", "₹0.00", "N/A", "₹0.00", "N/A", "₹0.00"];
+                }
+                return [
+                    rupees(kpis.total),
+                    rupees(kpis.average),
+                    kpis.highest[0],
+                    rupees(kpis.highest[1]),
+                    kpis.lowest[0],
+                    rupees(kpis.lowest[1])
+                ];
+            },
+
+            savingsKpis: function (kpis) {
+                if (!kpis) {
+                    return ["₹0.00", "₹0.00", "₹0.00"];
+                }
+                return [rupees(kpis.credit), rupees(kpis.debit), rupees(kpis.net)];
+            },
+
+            // Hand a lazy chart its figure once lazygraphs.js has seen it on screen
+            showWhenVisible: function (figure, visible) {
+                if (!visible || !figure) {
+                    return window.dash_clientside.no_update;
+                }
+                return figure;
+            },
+
+            installmentKpis: function (installmentsLeft) {
+                if (!installmentsLeft) {
+                    return ["N/A", "N/A", "N/A"];
+                }
+                return [
+                    String(installmentsLeft.lic),
+                    String(installmentsLeft.kumaran),
+                    String(installmentsLeft.thangamayil)
+                ];
+            }
+        }
+    });
+})();
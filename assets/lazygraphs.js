@@ -0,0 +1,44 @@
+// Flags each .lazy-graph as visible the first time it scrolls near the
+// viewport, by setting the store named in its data-visible-store attribute.
+// Pages are rendered by Dash after load, so new charts are picked up with a
+// MutationObserver. Browsers without IntersectionObserver get every chart
+// flagged visible as soon as it appears, so the charts still render.
+(function () {
+    function reveal(chart) {
+        window.dash_clientside.set_props(chart.dataset.visibleStore, {data: true});
+    }
+
+    var visibility = null;
+    if ("IntersectionObserver" in window) {
+        visibility = new IntersectionObserver(function (entries) {
+            entries.forEach(function (entry) {
+                if (entry.isIntersecting) {
+                    visibility.unobserve(entry.target);
+                    reveal(entry.target);
+                }
+            });
+        }, {rootMargin: "200px"});
+    }
+
+    function observeNewCharts() {
+        document.querySelectorAll(".lazy-graph:not([data-observed])").forEach(function (chart) {
+            chart.dataset.observed = "true";
+            if (visibility) {
+                visibility.observe(chart);
+            } else {
+                reveal(chart);
+            }
+        });
+    }
+
+    function start() {
+        new MutationObserver(observeNewCharts).observe(document.body, {childList: true, subtree: true});
+        observeNewCharts();
+    }
+
+    if (document.readyState === "loading") {
+        document.addEventListener("DOMContentLoaded", start);
+    } else {
+        start();
+    }
+})();
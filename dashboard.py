@@ -1,29 +1,49 @@
 import pandas as pd
+import numpy as np
 import gspread
+from gspread.utils import absolute_range_name, fill_gaps
 from google.oauth2.service_account import Credentials
-from dash import Dash, dcc, html, dash_table, Input, Output, State, no_update
-import plotly.express as px
+from google.auth.transport.requests import AuthorizedSession
+from google.auth.exceptions import RefreshError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from dash import ClientsideFunction, Dash, DiskcacheManager, Patch, dcc, html, dash_table, Input, Output, State, no_update, callback_context
+import diskcache
 import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.offline import get_plotlyjs_version
 import re
 import dash_bootstrap_components as dbc
 import os
 import time
 import json
-import tempfile
 import base64
+import hashlib
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from threading import Lock
+from functools import lru_cache
+from cachetools import LRUCache, cached
+from flask_caching import Cache
+from flask_compress import Compress
+from flask.json.provider import DefaultJSONProvider
+import orjson
 
 # --- Helper function to ensure unique column names ---
 def make_unique_column_names(column_list):
     seen = {}
+    used = set()  # O(1) membership instead of scanning unique_list
     unique_list = []
     for col in column_list:
         original_col_name = str(col).strip()
         current_col_name = original_col_name
         count = seen.get(original_col_name, 0)
-        while current_col_name in unique_list:
+        while current_col_name in used:
             count += 1
             current_col_name = f"{original_col_name}_{count}"
         seen[original_col_name] = count
+        used.add(current_col_name)
         unique_list.append(current_col_name)
     return unique_list
 
@@ -31,232 +51,436 @@ def make_unique_column_names(column_list):
 # IMPORTANT: This section has been updated to handle credentials securely
 # for deployment.
 
-# Check for credentials in an environment variable for deployment
+# Check for credentials in an environment variable for deployment.
+# The decoded key is kept in memory and handed to the credentials loader
+# directly, so the secret is never written to a temp file.
+SERVICE_ACCOUNT_INFO = None
+SERVICE_ACCOUNT_FILE = r"C:\Users\JEEVALAKSHMI R\Videos\dashboard_for_expense\icic-salary-data-52568c61b6e3.json"
 if "GCP_SA_CREDENTIALS" in os.environ:
     credentials_content_base64 = os.environ.get("GCP_SA_CREDENTIALS")
     try:
-        # Decode the Base64 content and write it to a temporary file
-        credentials_content = base64.b64decode(credentials_content_base64).decode('utf-8')
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as temp:
-            temp.write(credentials_content)
-            temp_file_path = temp.name
+        # Decode the Base64 content into the service-account key dict
+        SERVICE_ACCOUNT_INFO = json.loads(base64.b64decode(credentials_content_base64))
         print("✅ Success: Using credentials from environment variable.")
-        SERVICE_ACCOUNT_FILE = temp_file_path
     except Exception as e:
         print(f"❌ Error decoding credentials from environment variable: {e}")
         # Fallback in case of decoding error
         SERVICE_ACCOUNT_FILE = "no_valid_path"
 else:
     print("⚠️ Warning: Environment variable 'GCP_SA_CREDENTIALS' not found. Falling back to local file path.")
-    SERVICE_ACCOUNT_FILE = r"C:\Users\JEEVALAKSHMI R\Videos\dashboard_for_expense\icic-salary-data-52568c61b6e3.json"
 
-def load_data_from_google_sheets():
+def has_credentials():
+    return SERVICE_ACCOUNT_INFO is not None or os.path.exists(SERVICE_ACCOUNT_FILE)
+
+def load_credentials():
+    if SERVICE_ACCOUNT_INFO is not None:
+        return Credentials.from_service_account_info(SERVICE_ACCOUNT_INFO, scopes=SHEET_SCOPES)
+    return Credentials.from_service_account_file(SERVICE_ACCOUNT_FILE, scopes=SHEET_SCOPES)
+
+SHEET_URL = "https://docs.google.com/spreadsheets/d/1o1e8ouOghU_1L592pt_OSxn6aUSY5KNm1HOT6zbbQOA/edit?gid=1788780645#gid=1788780645"
+SHEET_SCOPES = [
+    "https://www.googleapis.com/auth/spreadsheets.readonly",
+    "https://www.googleapis.com/auth/drive.readonly",
+]
+SHEET_TITLES = ("ICIC salary", "CANARA", "GOLD & LIC & DEPOSITS")
+
+# --- Shared Sheets client ---
+# The client is authorized and the spreadsheet opened once per process, over a
+# pooled HTTP session that keeps connections alive between calls and retries
+# rate-limit/5xx responses with backoff. The web workers keep theirs for their
+# whole lifetime, and every revision poll runs there (check_sheet_revision).
+# A background load job is a forked child: it builds its own client rather
+# than share the parent's pooled sockets, and it only runs when the sheet
+# actually changed.
+_spreadsheet = None
+_spreadsheet_pid = None
+_spreadsheet_lock = Lock()
+
+def get_spreadsheet():
+    global _spreadsheet, _spreadsheet_pid
+    with _spreadsheet_lock:
+        if _spreadsheet is None or _spreadsheet_pid != os.getpid():
+            creds = load_credentials()
+            session = AuthorizedSession(creds)
+            retries = Retry(total=5, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+            session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries))
+            client = gspread.Client(auth=creds, session=session)
+            _spreadsheet = client.open_by_url(SHEET_URL)
+            _spreadsheet_pid = os.getpid()
+        return _spreadsheet
+
+def reset_spreadsheet():
+    global _spreadsheet
+    with _spreadsheet_lock:
+        _spreadsheet = None
+
+SNAPSHOT_TTL_SECONDS = 6 * 3600
+# Upper bound on holding the per-revision load lock, so a crashed job can't wedge it
+SNAPSHOT_LOCK_SECONDS = 120
+
+# Drive modifiedTime of the spreadsheet, used to skip reloading unchanged data.
+# None when it can't be read, which always forces a full load.
+# Called from check_sheet_revision in the web worker, whose cached client
+# persists, so dropping it on RefreshError makes the next poll re-authorize.
+def get_sheet_revision():
+    if not has_credentials():
+        return None
+    try:
+        return get_spreadsheet().get_lastUpdateTime()
+    except RefreshError as e:
+        reset_spreadsheet()  # The token can no longer be refreshed; re-authorize next time
+        print(f"Could not read the spreadsheet revision: {e}")
+        return None
+    except Exception as e:
+        print(f"Could not read the spreadsheet revision: {e}")
+        return None
+
+# --- Processed-frame Parquet cache ---
+# The processed frames of the last successful load are kept as zstd Parquet
+# files next to a meta.json recording the revision they came from. A cold
+# worker whose sheet is unchanged reads them back in milliseconds instead of
+# fetching and re-parsing every tab. It outlives the snapshot TTL and holds
+# only the latest revision.
+PARQUET_CACHE_DIR = os.path.join("dash_cache", "sheets")
+PARQUET_FRAMES = ("icic", "canara", "investments")
+
+def read_parquet_frames(revision):
+    try:
+        with open(os.path.join(PARQUET_CACHE_DIR, "meta.json")) as f:
+            meta = json.load(f)
+        if revision is None or meta["revision"] != revision:
+            return None
+        frames = []
+        for name in PARQUET_FRAMES:
+            if name not in meta["frames"]:
+                frames.append(pd.DataFrame())
+                continue
+            frames.append(frame_from_arrow(pq.read_table(os.path.join(PARQUET_CACHE_DIR, f"{name}.parquet"))))
+        return tuple(frames)
+    except (OSError, ValueError, KeyError, pa.ArrowException):
+        return None
+
+def write_parquet_frames(revision, frames):
+    os.makedirs(PARQUET_CACHE_DIR, exist_ok=True)
+    written = []
+    for name, df in zip(PARQUET_FRAMES, frames):
+        if df.empty:
+            continue
+        # Write-then-rename so a concurrent reader never sees a partial file
+        path = os.path.join(PARQUET_CACHE_DIR, f"{name}.parquet")
+        pq.write_table(pa.Table.from_pandas(df, preserve_index=False), f"{path}.tmp", compression="zstd")
+        os.replace(f"{path}.tmp", path)
+        written.append(name)
+    meta_path = os.path.join(PARQUET_CACHE_DIR, "meta.json")
+    with open(f"{meta_path}.tmp", "w") as f:
+        json.dump({"revision": revision, "frames": written}, f)
+    os.replace(f"{meta_path}.tmp", meta_path)
+
+def sheet_rows(sheet_values, title):
+    if title not in sheet_values:
+        raise gspread.exceptions.WorksheetNotFound(title)
+    return sheet_values[title]
+
+def load_data_from_google_sheets(revision=None, force=False):
     df_icic = pd.DataFrame()
     df_canara = pd.DataFrame()
     df_investments = pd.DataFrame()
     error_message = None
 
+    # Unchanged since the last processed load: skip the network and parsing
+    cached_frames = None if force else read_parquet_frames(revision)
+    if cached_frames is not None:
+        return cached_frames + (None,)
+
     # This check is now crucial for the fallback to work
-    if not os.path.exists(SERVICE_ACCOUNT_FILE):
+    if not has_credentials():
         error_message = f"❌ Error: Service account file not found at {SERVICE_ACCOUNT_FILE}. The environment variable is missing or the hardcoded path is incorrect."
         return df_icic, df_canara, df_investments, error_message
     
     try:
-        scope = [
-            "https://www.googleapis.com/auth/spreadsheets.readonly",
-            "https://www.googleapis.com/auth/drive.readonly",
-        ]
-        creds = Credentials.from_service_account_file(SERVICE_ACCOUNT_FILE, scopes=scope)
-        client = gspread.authorize(creds)
-
-        sheet_url = "https://docs.google.com/spreadsheets/d/1o1e8ouOghU_1L592pt_OSxn6aUSY5KNm1HOT6zbbQOA/edit?gid=1788780645#gid=1788780645"
-        spreadsheet = client.open_by_url(sheet_url)
+        spreadsheet = get_spreadsheet()
+
+        # Fetch every tab in a single values:batchGet round trip instead of a
+        # get_all_values() call per worksheet. One metadata lookup comes first:
+        # batchGet fails outright if any range names a missing tab, so absent
+        # tabs are dropped up front and skipped like before.
+        # Numbers arrive unformatted (no thousands separators to strip); dates
+        # keep their displayed text so Month labels read as they do in the sheet
+        available_titles = {worksheet.title for worksheet in spreadsheet.worksheets()}
+        present_titles = [title for title in SHEET_TITLES if title in available_titles]
+        sheet_values = {}
+        if present_titles:
+            response = spreadsheet.values_batch_get(
+                [absolute_range_name(title) for title in present_titles],
+                params={"valueRenderOption": "UNFORMATTED_VALUE", "dateTimeRenderOption": "FORMATTED_STRING"},
+            )
+            for title, value_range in zip(present_titles, response.get("valueRanges", [])):
+                # Pad ragged rows with "" like get_all_values() does
+                sheet_values[title] = fill_gaps(value_range.get("values", []))
 
-        # Load ICIC Salary Data
-        try:
-            worksheet_icic = spreadsheet.worksheet("ICIC salary")
-            data_icic = worksheet_icic.get_all_values()
-            df_raw_icic = pd.DataFrame(data_icic)
-            df_icic, icic_error = process_icic_salary_data(df_raw_icic)
-            if icic_error:
-                print(f"ICIC Data Processing Warning: {icic_error}") # Log warning, don't block
-        except gspread.exceptions.WorksheetNotFound:
-            print("Warning: 'ICIC salary' worksheet not found. Skipping ICIC data load.")
-        except Exception as e:
-            print(f"Error loading 'ICIC salary' sheet: {e}")
-
-        # Load CANARA Data
-        try:
-            worksheet_canara = spreadsheet.worksheet("CANARA")
-            data_canara = worksheet_canara.get_all_values()
-            df_raw_canara = pd.DataFrame(data_canara)
-            df_canara, canara_error = process_canara_data(df_raw_canara)
-            if canara_error:
-                print(f"CANARA Data Processing Warning: {canara_error}") # Log warning
-        except gspread.exceptions.WorksheetNotFound:
-            print("Warning: 'CANARA' worksheet not found. Skipping CANARA data load.")
-        except Exception as e:
-                print(f"Error loading 'CANARA' sheet: {e}")
-
-        # Load Investments Data
-        try:
-            worksheet_investments = spreadsheet.worksheet("GOLD & LIC & DEPOSITS")
-            data_investments = worksheet_investments.get_all_values()
-            df_raw_investments = pd.DataFrame(data_investments)
-            df_investments, investments_error = process_investments_data(df_raw_investments)
-            if investments_error:
-                print(f"Investments Data Processing Warning: {investments_error}")
-        except gspread.exceptions.WorksheetNotFound:
-            print("Warning: 'GOLD & LIC & DEPOSITS' worksheet not found. Skipping Investments data load.")
-        except Exception as e:
-            print(f"Error loading 'GOLD & LIC & DEPOSITS' sheet: {e}")
+        df_icic, df_canara, df_investments = (load_sheet(sheet_values, *loader) for loader in SHEET_LOADERS)
 
     except Exception as e:
+        reset_spreadsheet()  # Re-authorize on the next load rather than reuse a broken client
         error_message = f"Error authenticating or retrieving Google Sheet: {e}. Check your JSON key and sheet URL."
         return df_icic, df_canara, df_investments, error_message
-        
+
+    df_icic = arrow_strings(categorize_keys(downcast_amounts(df_icic)))
+    df_canara = arrow_strings(categorize_keys(downcast_amounts(df_canara)))
+    df_investments = arrow_strings(categorize_keys(downcast_amounts(df_investments)))
+    if revision is not None:
+        try:
+            write_parquet_frames(revision, (df_icic, df_canara, df_investments))
+        except (OSError, pa.ArrowException) as e:
+            print(f"Could not write the Parquet cache: {e}")
     return df_icic, df_canara, df_investments, error_message
 
-def process_icic_salary_data(df_raw):
+# Rupee amounts fit comfortably in float32; halving the column width halves
+# the bytes every sum/groupby in the callbacks has to stream through.
+# float32 spacing stays under one paisa only below 2**17, so a column holding
+# a larger value is left as float64 rather than lose its paise.
+AMOUNT_COLUMNS = ("Amount", "Debit", "Credit")
+FLOAT32_EXACT_LIMIT = 2 ** 17
+
+def downcast_amounts(df):
+    for col in AMOUNT_COLUMNS:
+        if col in df.columns and df[col].abs().max() < FLOAT32_EXACT_LIMIT:
+            df[col] = df[col].astype("float32")
+    return df
+
+# Month and Category are low-cardinality filter/group keys. As categoricals,
+# unique/isin/groupby work on small integer codes instead of hashing Python
+# strings, and the sorted category list doubles as the dropdown options.
+# Month categories are ordered chronologically when every label parses under
+# one of MONTH_FORMATS, so trend charts and dropdowns run Jan, Feb, ... rather
+# than A-Z. Formats are tried in order and each is exact, so ISO dates are
+# never read day-first. Numeric slash/dot dates are tried day-first before
+# month-first because the sheet is Indian-locale. Labels that don't all
+# share one format stay A-Z and unordered.
+KEY_COLUMNS = ("Month", "Category")
+MONTH_FORMATS = (
+    # ICIC labels are the tail of "Amount spent in <month>"
+    "%B", "%b", "%B %Y", "%b %Y", "%B-%Y", "%b-%Y", "%b-%y",
+    "%Y-%m-%d", "%Y-%m",
+    "%d/%m/%Y", "%d/%m/%y", "%d.%m.%Y", "%d.%m.%y",
+    "%m/%d/%Y", "%m/%d/%y",
+)
+
+def month_order(labels):
+    labels = sorted(labels)
+    texts = pd.Series([str(label).strip() for label in labels], dtype=object)
+    for fmt in MONTH_FORMATS if labels else ():
+        dates = pd.to_datetime(texts, format=fmt, errors="coerce")
+        if not dates.isna().any():
+            return [labels[i] for i in np.argsort(dates.to_numpy(), kind="stable")], True
+    return labels, False
+
+def categorize_keys(df):
+    for col in KEY_COLUMNS:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            if col == "Month":
+                categories, ordered = month_order(pd.unique(df[col].dropna()))
+                df[col] = pd.Categorical(df[col], categories=categories, ordered=ordered)
+            else:
+                df[col] = df[col].astype("category")
+    return df
+
+# Remaining free-text columns (e.g. CANARA's Description) are held as
+# Arrow-backed strings rather than one Python object per cell, which cuts
+# their memory several-fold and keeps .str operations out of the interpreter.
+ARROW_STRING = pd.StringDtype("pyarrow")
+
+def arrow_strings(df):
+    for col in df.columns:
+        if df[col].dtype == object:
+            df[col] = df[col].astype(ARROW_STRING)
+    return df
+
+# ICIC amount headers read "Amount spent in <month>"; the month label is the rest
+AMOUNT_SPENT_RE = re.compile(r"amount\s*spent\s*in", re.IGNORECASE)
+WHITESPACE_RE = re.compile(r"\s+")
+
+def clean_month_label(amt_header):
+    return WHITESPACE_RE.sub(" ", AMOUNT_SPENT_RE.sub("", str(amt_header)).strip())
+
+# Cells arrive unformatted, so amounts are normally numbers already and are
+# coerced in one pass. Only cells that fail (blanks, or amounts typed as text
+# such as "1,200") get a second look with thousands separators removed.
+def to_amounts(values):
+    amounts = pd.to_numeric(values, errors="coerce").astype("float64")
+    failed = np.flatnonzero(np.isnan(amounts))
+    if len(failed):
+        text = pd.Series(values[failed], dtype=object).astype(str).str.replace(",", "", regex=False)
+        amounts[failed] = pd.to_numeric(text, errors="coerce").to_numpy(dtype="float64")
+    return amounts
+
+# Takes the sheet's raw list-of-lists: the header is located on the rows
+# directly and only the data rows below it are turned into a DataFrame
+def process_icic_salary_data(rows):
     df_result = pd.DataFrame()
     error_message = None
 
-    if df_raw.empty:
+    if not rows:
         return df_result, "Raw DataFrame for ICIC is empty."
 
-    category_header_row = -1
-    for r_idx, row in df_raw.iterrows():
-        row_upper = [str(x).strip().upper() for x in row.tolist()]
-        if any("EXPENSES CATEGORY" in x for x in row_upper):
-            category_header_row = r_idx
-            break
+    # The header sits near the top, so a scan that stops at the first hit
+    # beats converting the whole sheet to an array
+    category_header_row = next(
+        (r_idx for r_idx, row in enumerate(rows) if any("EXPENSES CATEGORY" in str(x).upper() for x in row)),
+        -1
+    )
 
     if category_header_row == -1:
         return pd.DataFrame(), "Could not find 'EXPENSES CATEGORY' header in ICIC sheet."
     else:
-        raw_header_values = df_raw.iloc[category_header_row].tolist()
+        raw_header_values = rows[category_header_row]
         unique_cols = make_unique_column_names(raw_header_values)
-        df_data = pd.DataFrame(df_raw.iloc[category_header_row + 1:].values, columns=unique_cols)
-
-        def is_category(colname: str) -> bool:
-            return isinstance(colname, str) and ("EXPENSES CATEGORY" in colname.upper())
-
-        def is_amount(colname: str) -> bool:
-            return isinstance(colname, str) and ("AMOUNT SPENT IN" in colname.upper())
+        df_data = pd.DataFrame(rows[category_header_row + 1:], columns=unique_cols)
 
+        # Flag category/amount header columns in one vectorized pass
         cols = list(df_data.columns)
-        amt_cols_idx = [i for i, c in enumerate(cols) if is_amount(c)]
-
-        pairs = []
-        for ai in amt_cols_idx:
-            amt_col = cols[ai]
-            cat_idx = None
-            for cj in range(ai - 1, -1, -1):
-                if is_category(cols[cj]):
-                    cat_idx = cj
-                    break
-            if cat_idx is not None:
-                pairs.append((cols[cat_idx], amt_col))
+        cols_upper = np.char.upper(np.asarray(cols, dtype=str))
+        cat_positions = np.flatnonzero(np.char.find(cols_upper, "EXPENSES CATEGORY") >= 0)
+        amt_positions = np.flatnonzero(np.char.find(cols_upper, "AMOUNT SPENT IN") >= 0)
+
+        # Pair each amount column with the nearest category column to its left
+        # (category column position, amount column position)
+        nearest = np.searchsorted(cat_positions, amt_positions) - 1
+        has_category = nearest >= 0
+        pairs = list(zip(cat_positions[nearest[has_category]].tolist(), amt_positions[has_category].tolist()))
 
         if not pairs:
             return pd.DataFrame(), "Could not pair category with amount columns in ICIC sheet."
         else:
-            def clean_month_label(amt_header: str) -> str:
-                label = re.sub(r"(?i)amount\s*spent\s*in", "", str(amt_header)).strip()
-                return re.sub(r"\s+", " ", label)
-
-            frames = []
-            for cat_col, amt_col in pairs:
-                tmp = df_data[[cat_col, amt_col]].copy()
-                tmp.columns = ["Category", "Amount"]
-                tmp = tmp[tmp["Category"].astype(str).str.strip() != ""]
-                tmp["Category"] = tmp["Category"].astype(str).str.strip()
-                tmp["Amount"] = pd.to_numeric(tmp["Amount"].astype(str).str.replace(",", ""), errors="coerce")
-                tmp["Month"] = clean_month_label(amt_col)
-                frames.append(tmp)
-
-            df_result = pd.concat(frames, ignore_index=True)
+            # Melt every (category, amount) pair in one shot: the paired columns
+            # are stacked as two aligned 2-D blocks and flattened column-major,
+            # so rows come out pair by pair, and each cleaning step runs once
+            cat_idx = [cat for cat, _ in pairs]
+            amt_idx = [amt for _, amt in pairs]
+            months = [clean_month_label(cols[amt]) for amt in amt_idx]
+            df_result = pd.DataFrame({
+                "Category": df_data.iloc[:, cat_idx].to_numpy().ravel(order="F"),
+                "Amount": df_data.iloc[:, amt_idx].to_numpy().ravel(order="F"),
+                "Month": np.repeat(months, len(df_data)),
+            })
+            df_result["Category"] = df_result["Category"].astype(str).str.strip()
+            df_result = df_result[df_result["Category"] != ""].reset_index(drop=True)
+            df_result["Amount"] = to_amounts(df_result["Amount"].to_numpy())
             df_result = df_result.dropna(subset=["Amount"])
-            df_result["Amount"] = df_result["Amount"].fillna(0)
             
     return df_result, error_message
 
-def process_canara_data(df_raw):
+# Rows arrive padded to a rectangle by fill_gaps, so they convert straight to
+# a 2-D object array; only the narrow result frame is built with pandas
+def sheet_array(rows):
+    return np.asarray(rows, dtype=object)
+
+def process_canara_data(rows):
+    arr = sheet_array(rows)
     df_result = pd.DataFrame()
     error_message = None
 
-    if df_raw.empty:
+    if arr.ndim != 2 or arr.size == 0:
         return df_result, "Raw DataFrame for CANARA is empty."
 
-    if len(df_raw) <= 4:
+    if len(arr) <= 4:
         return df_result, "CANARA sheet has insufficient rows for data."
 
-    df_data = pd.DataFrame(df_raw.iloc[4:, :5].values, columns=['Month', 'Description', 'Category', 'Debit', 'Credit'])
+    raw = arr[4:, :5]
 
-    df_data["Month"] = df_data["Month"].astype(str).str.strip()
-    df_data["Category"] = df_data["Category"].astype(str).str.strip()
-    
-    df_data["Debit"] = pd.to_numeric(df_data["Debit"].astype(str).str.replace(",", ""), errors="coerce").fillna(0)
-    df_data["Credit"] = pd.to_numeric(df_data["Credit"].astype(str).str.replace(",", ""), errors="coerce").fillna(0)
-    
-    df_result = df_data[(df_data["Debit"] != 0) | (df_data["Credit"] != 0)].copy()
+    # Amounts are fetched unformatted; blanks and stray text coerce to NaN -> 0.
+    # Rows with neither a debit nor a credit are dropped before any string work
+    debit = np.nan_to_num(to_amounts(raw[:, 3]))
+    credit = np.nan_to_num(to_amounts(raw[:, 4]))
+    keep = (debit != 0) | (credit != 0)
+
+    df_result = pd.DataFrame(raw[keep, :3], columns=['Month', 'Description', 'Category'])
+    df_result["Month"] = df_result["Month"].astype(str).str.strip()
+    df_result["Category"] = df_result["Category"].astype(str).str.strip()
+    df_result["Debit"] = debit[keep]
+    df_result["Credit"] = credit[keep]
 
     return df_result, error_message
 
-def process_investments_data(df_raw):
+def process_investments_data(rows):
+    arr = sheet_array(rows)
     df_result = pd.DataFrame()
     error_message = None
 
-    if df_raw.empty or len(df_raw.columns) < 2:
+    if arr.ndim != 2 or arr.size == 0 or arr.shape[1] < 2:
         return df_result, "Raw DataFrame for Investments is empty or has insufficient columns."
     
     # Assuming months are in the first column, starting from the second row
     # The first row (index 0) contains the category names
-    header_row = df_raw.iloc[0].tolist()
-    
-    frames = []
+    header = np.char.strip(arr[0].astype(str))
     
-    # Iterate through columns, skipping the first one (Month)
-    for i in range(len(header_row)):
-        # Check if the column is an investment category (e.g., KUMARAN, THANGAMAYIL)
-        category_name = str(header_row[i]).strip()
-        
-        # We need to find the pairs of category name and amount columns
-        # The pattern is: [Category Name], [Amount Invested], [Category Name], [Amount Invested]...
-        if category_name and category_name.upper() != 'AMOUNT INVESTED':
-            try:
-                # The 'Amount Invested' column should be the next one
-                amount_col_name = str(header_row[i+1]).strip()
-                if amount_col_name.upper() == 'AMOUNT INVESTED':
-                    category_col_data = df_raw.iloc[1:, i].tolist()
-                    amount_col_data = df_raw.iloc[1:, i+1].tolist()
-                    
-                    # Create a temporary DataFrame for this category's data
-                    tmp_df = pd.DataFrame({
-                        "Category": [category_name] * len(category_col_data),
-                        "Month": category_col_data,
-                        "Amount": amount_col_data
-                    })
-                    frames.append(tmp_df)
-            except IndexError:
-                # This handles cases where the last category doesn't have a following column
-                continue
+    # We need to find the pairs of category name and amount columns
+    # The pattern is: [Category Name], [Amount Invested], [Category Name], [Amount Invested]...
+    # A category column is any non-empty header other than 'Amount Invested'
+    # whose right-hand neighbour is 'Amount Invested'; all are found in one pass
+    is_amount = np.char.upper(header) == 'AMOUNT INVESTED'
+    cat_positions = np.flatnonzero((header[:-1] != '') & ~is_amount[:-1] & is_amount[1:])
                 
-    if frames:
-        df_result = pd.concat(frames, ignore_index=True)
+    if len(cat_positions):
+        # Month/amount blocks of every pair flattened column-major: rows come
+        # out pair by pair, with the category name repeated per pair
+        n_rows = len(arr) - 1
+        df_result = pd.DataFrame({
+            "Category": np.repeat(header[cat_positions], n_rows),
+            "Month": arr[1:, cat_positions].ravel(order="F"),
+            "Amount": arr[1:, cat_positions + 1].ravel(order="F"),
+        })
         
-        # Data Cleaning
-        df_result = df_result[df_result['Month'].astype(str).str.strip() != '']
-        df_result['Amount'] = pd.to_numeric(df_result['Amount'].astype(str).str.replace(',', ''), errors='coerce')
-        df_result = df_result.dropna(subset=['Amount'])
-        df_result['Amount'] = df_result['Amount'].fillna(0)
-        df_result['Category'] = df_result['Category'].astype(str).str.strip()
+        # Data Cleaning: Month is stripped once and blank months dropped
         df_result['Month'] = df_result['Month'].astype(str).str.strip()
+        df_result = df_result[df_result['Month'] != '']
+        df_result['Amount'] = to_amounts(df_result['Amount'].to_numpy())
+        df_result = df_result.dropna(subset=['Amount'])
     else:
         error_message = "No valid investment data found."
 
     return df_result, error_message
 
+# (worksheet title, processor, label used in log messages)
+# Processors take the tab's raw list-of-lists
+SHEET_LOADERS = (
+    ("ICIC salary", process_icic_salary_data, "ICIC"),
+    ("CANARA", process_canara_data, "CANARA"),
+    ("GOLD & LIC & DEPOSITS", process_investments_data, "Investments"),
+)
+
+# Process one fetched tab; a missing or malformed tab is logged and yields an
+# empty frame rather than blocking the other tabs
+def load_sheet(sheet_values, title, processor, label):
+    try:
+        df, error = processor(sheet_rows(sheet_values, title))
+        if error:
+            print(f"{label} Data Processing Warning: {error}") # Log warning, don't block
+        return df
+    except gspread.exceptions.WorksheetNotFound:
+        print(f"Warning: '{title}' worksheet not found. Skipping {label} data load.")
+    except Exception as e:
+        print(f"Error loading '{title}' sheet: {e}")
+    return pd.DataFrame()
+
+# --- Installment plans tracked on the Investments page ---
+# key: (category name in the sheet, total number of installments)
+INSTALLMENT_PLANS = {
+    "lic": ("LIC", 12 * 25),  # Assuming 25 year policy, 12 payments a year
+    "kumaran": ("KUMARAN", 100),
+    "thangamayil": ("THANGAMAYIL", 100),
+}
+
+def compute_installments_left(df_investments):
+    if df_investments.empty:
+        return None
+    # One counting pass over the categorical codes covers every plan
+    installments_paid = df_investments["Category"].value_counts()
+    return {
+        key: total - int(installments_paid.get(category_name, 0))
+        for key, (category_name, total) in INSTALLMENT_PLANS.items()
+    }
+
 # --- Custom Color Palette for Charts (Vaporwave Synapse Theme) ---
 CUSTOM_COLOR_PALETTE = [
     "#00FFFF",   # Cyan
@@ -272,31 +496,168 @@ CUSTOM_COLOR_PALETTE = [
     "#00FA9A"    # MediumSpringGreen
 ]
 
+# --- Shared figure layouts and trace builders ---
+# Every chart uses the same dark, transparent theme with a fixed title and
+# axis labels, so each chart's layout is built once here. Callbacks only
+# create the traces and attach the prebuilt layout, skipping Plotly Express's
+# frame reshaping and the per-call template and update_layout() merges.
+def chart_layout(title, title_color, legend_title=None, **layout):
+    return go.Layout(
+        template="plotly_dark",
+        title=dict(text=f"<span style='color:{title_color}'>{title}</span>", x=0.5),
+        plot_bgcolor="rgba(0,0,0,0)",
+        paper_bgcolor="rgba(0,0,0,0)",
+        font=dict(color=CUSTOM_COLOR_PALETTE[0]),
+        legend=dict(title_text=legend_title, tracegroupgap=0),
+        **layout,
+    )
+
+def line_trace(x, y, x_label, y_label, color):
+    return go.Scatter(
+        x=x, y=y, mode="lines+markers", line=dict(color=color), showlegend=False,
+        hovertemplate=f"{x_label}=%{{x}}<br>{y_label}=%{{y}}<extra></extra>",
+    )
+
+def pie_trace(labels, values, label_name, value_name):
+    return go.Pie(
+        labels=labels, values=values, hole=0.4, showlegend=True,
+        hovertemplate=f"{label_name}=%{{label}}<br>{value_name}=%{{value}}<extra></extra>",
+    )
+
+def bar_trace(x, y, x_label, y_label, color):
+    return go.Bar(
+        x=x, y=y, marker_color=color, showlegend=False,
+        hovertemplate=f"{x_label}=%{{x}}<br>{y_label}=%{{y}}<extra></extra>",
+    )
+
+# One bar trace per group, coloured in order of first appearance like px.bar(color=...)
+def grouped_bar_traces(frame, x, y, group, y_label):
+    traces = []
+    for i, (name, rows) in enumerate(frame.groupby(group, sort=False, observed=True)):
+        traces.append(go.Bar(
+            x=rows[x], y=rows[y], name=name, legendgroup=name, offsetgroup=name, alignmentgroup="True", showlegend=True,
+            marker_color=CUSTOM_COLOR_PALETTE[i % len(CUSTOM_COLOR_PALETTE)],
+            hovertemplate=f"{group}={name}<br>{x}=%{{x}}<br>{y_label}=%{{y}}<extra></extra>",
+        ))
+    return traces
+
+DASHBOARD_TREND_LAYOUT = chart_layout(
+    "Monthly Expense Trend", CUSTOM_COLOR_PALETTE[0], xaxis_title="Month", yaxis_title="Amount (₹)"
+)
+DASHBOARD_PIE_LAYOUT = chart_layout(
+    "Top 10 Expense Categories", CUSTOM_COLOR_PALETTE[1], piecolorway=CUSTOM_COLOR_PALETTE
+)
+DASHBOARD_BAR_LAYOUT = chart_layout(
+    "Monthly Expenses Breakdown by Category", CUSTOM_COLOR_PALETTE[2], legend_title="Category",
+    barmode="group", xaxis_title="Month", yaxis_title="Amount (₹)"
+)
+SAVINGS_TREND_LAYOUT = chart_layout(
+    "Monthly Net Savings Trend", CUSTOM_COLOR_PALETTE[0], xaxis_title="Month", yaxis_title="Net Savings (₹)"
+)
+SAVINGS_BAR_LAYOUT = chart_layout(
+    "Savings by Category", CUSTOM_COLOR_PALETTE[1], xaxis_title="Category", yaxis_title="Total Savings (₹)"
+)
+INVESTMENTS_TREND_LAYOUT = chart_layout(
+    "Monthly Investments Trend", CUSTOM_COLOR_PALETTE[0], xaxis_title="Month", yaxis_title="Amount (₹)"
+)
+INVESTMENTS_PIE_LAYOUT = chart_layout(
+    "Investments by Category", CUSTOM_COLOR_PALETTE[1], piecolorway=CUSTOM_COLOR_PALETTE
+)
+INVESTMENTS_BAR_LAYOUT = chart_layout(
+    "Monthly Investments Breakdown by Category", CUSTOM_COLOR_PALETTE[2], legend_title="Category",
+    barmode="group", xaxis_title="Month", yaxis_title="Amount (₹)"
+)
+
+# Empty results still get their chart's layout, only without traces: the graph
+# keeps its title, axes and theme, and a later filter Patch that swaps only
+# "data" (patch_figures) lands on a styled chart instead of a blank default.
+def empty_figure(layout):
+    return go.Figure(layout=layout)
+
 # --- Generate a cache-busting timestamp ---
 cache_buster = int(time.time())
 
+# --- Background callback manager ---
+# Long-running callbacks (the Google Sheets load) run in a separate process
+# so the web worker stays free to serve filter interactions meanwhile.
+background_cache = diskcache.Cache("./dash_cache")
+background_callback_manager = DiskcacheManager(background_cache)
+
+# --- Plotly.js bundle ---
+# Every chart is a scatter, bar or pie trace, all covered by plotly.js's basic
+# partial bundle (~1MB vs ~3.5MB for the full one). dcc.Graph uses a
+# window.Plotly that is already loaded instead of fetching its bundled full
+# build, so the basic bundle is loaded up front. The version follows the
+# installed plotly's bundled plotly.js, the same source Dash uses for its own
+# CDN URL, so an upgrade can't leave the two out of step.
+PLOTLY_BASIC_JS = f"https://cdn.plot.ly/plotly-basic-{get_plotlyjs_version()}.min.js"
+
 # --- Dash App Initialization ---
 app = Dash(__name__, external_stylesheets=[
     dbc.themes.DARKLY,
     dbc.icons.BOOTSTRAP,
     f'/assets/new_style.css?v={cache_buster}'
-], suppress_callback_exceptions=True)
+], external_scripts=[PLOTLY_BASIC_JS], suppress_callback_exceptions=True, background_callback_manager=background_callback_manager)
 server = app.server
 
+# --- Response compression ---
+# Store payloads, figure JSON and the JS bundles are highly compressible text;
+# brotli (or gzip for older clients) typically shrinks them 5-10x on the wire.
+server.config.update(
+    COMPRESS_ALGORITHM=["br", "gzip"],
+    COMPRESS_MIMETYPES=["application/json", "text/html", "text/css", "text/javascript", "application/javascript"],
+    COMPRESS_LEVEL=6,
+    COMPRESS_BR_LEVEL=5,
+    COMPRESS_MIN_SIZE=500,
+)
+Compress(server)
+
+# --- JSON serialization ---
+# Every callback request carries the full dcc.Store payloads it depends on.
+# orjson parses those bodies several times faster than the stdlib decoder,
+# and encodes Flask's own JSON responses (layout, dependencies) as well.
+# Anything orjson can't encode natively still goes through Flask's default hook.
+class OrjsonProvider(DefaultJSONProvider):
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+server.json = OrjsonProvider(server)
+# Callback outputs and figures are encoded by plotly's serializer; pin it to
+# orjson rather than relying on "auto" quietly falling back to the stdlib
+pio.json.config.default_engine = "orjson"
+
+# --- Server-side output cache ---
+# Page outputs (KPIs, figures) are a pure function of the store's
+# server-side digest (store_digest) and the selected filters, so they are
+# memoized process-wide and shared by every session looking at the same data.
+cache = Cache(server, config={"CACHE_TYPE": "SimpleCache", "CACHE_DEFAULT_TIMEOUT": 3600})
+
 # --- Layout of the Dashboard (Header-Only Vaporwave Synapse Theme) ---
 app.layout = dbc.Container(
     [
         dcc.Store(id='stored-icic-data'),
         dcc.Store(id='stored-canara-data'),
         dcc.Store(id='stored-investments-data'),  # New store for investments data
+        dcc.Store(id='stored-investments-precomp'),  # Installments left, computed once per load
         dcc.Store(id='loading-error-message'),
+        dcc.Store(id='sheet-revision'),  # Drive modifiedTime of the data this browser holds
+        dcc.Store(id='sheet-load-request'),  # Revision to load, set only when a load is needed
+        # Fires once on page load, then only as a slow background check for
+        # sheet edits; the Refresh Data button covers anything more urgent
         dcc.Interval(
             id='interval-component',
-            interval=60*1000,
+            interval=15*60*1000,
             n_intervals=0
         ),
         
         html.Div(id="data-load-status", className="data-load-alert"),
+        html.Div(id="data-load-progress", className="data-load-alert", style={"display": "none"}),
 
         # Top Header/Navbar
         dbc.Row(
@@ -316,6 +677,11 @@ app.layout = dbc.Container(
                             className="header-nav-new-theme",
                             horizontal=True,
                             pills=True
+                        ),
+                        html.Button(
+                            [html.I(className="bi bi-cloud-arrow-down me-2"), "Refresh Data"],
+                            id="refresh-data-button", n_clicks=0,
+                            className="btn-reset-new-theme"
                         )
                     ],
                     className="top-navbar-new-theme"
@@ -324,112 +690,147 @@ app.layout = dbc.Container(
             )
         ),
         dcc.Location(id='url', refresh=False),
-        html.Div(id='page-content')
+        # One shared loading overlay for the whole page instead of a spinner per chart/table
+        dcc.Loading(
+            id="loading-page-content", type="circle", color=CUSTOM_COLOR_PALETTE[0],
+            overlay_style={"visibility": "visible", "opacity": 0.6},
+            delay_show=300,
+            children=html.Div(id='page-content')
+        )
     ],
     fluid=True,
     className="dashboard-container-new-theme"
 )
 
+# --- Viewport-lazy charts ---
+# Charts below the fold are only drawn once scrolled into view: the page
+# callbacks write the figure into a store, and a clientside callback copies
+# it into the graph after assets/lazygraphs.js has flagged the chart visible
+# (IntersectionObserver). Plotly never lays out a chart nobody looks at.
+def lazy_graph(graph_id):
+    return html.Div(
+        [
+            dcc.Store(id=f"{graph_id}-figure"),
+            dcc.Store(id=f"{graph_id}-visible", data=False),
+            dcc.Graph(id=graph_id),
+        ],
+        className="lazy-graph",
+        **{"data-visible-store": f"{graph_id}-visible"}
+    )
+
+for lazy_graph_id in ("monthly-expenses-by-category-chart", "savings-category-bar-chart", "monthly-investments-by-category-chart"):
+    app.clientside_callback(
+        ClientsideFunction(namespace="dashboard", function_name="showWhenVisible"),
+        Output(lazy_graph_id, "figure"),
+        [Input(f"{lazy_graph_id}-figure", "data"), Input(f"{lazy_graph_id}-visible", "data")]
+    )
+
+# --- Page layouts ---
+# Each page's component tree is built on first visit by its factory and then
+# reused, so importing the app (and each worker's cold start) only pays for
+# the shell layout above.
+
 # --- Layout for the Dashboard Page ---
-dashboard_page_layout = dbc.Col(
-    [
-        # Filters Section
-        dbc.Row(
-            dbc.Col(
-                dbc.Card(
-                    dbc.CardBody([
-                        html.H5("Filter Your Data", className="card-title-new-theme text-center mb-3"),
-                        dbc.Row([
-                            dbc.Col(
-                                html.Div([
-                                    html.Label("Select Month(s):", className="form-label-new-theme"),
-                                    dcc.Dropdown(
-                                        id="month-filter",
-                                        options=[],
-                                        multi=True,
-                                        placeholder="All Months",
-                                        className="dropdown-new-theme"
-                                    ),
-                                ]),
-                                lg=5, md=6, sm=12, className="mb-3"
-                            ),
-                            dbc.Col(
-                                html.Div([
-                                    html.Label("Select Category(s):", className="form-label-new-theme"),
-                                    dcc.Dropdown(
-                                        id="category-filter",
-                                        options=[],
-                                        multi=True,
-                                        placeholder="All Categories",
-                                        className="dropdown-new-theme"
-                                    ),
-                                ]),
-                                lg=5, md=6, sm=12, className="mb-3"
-                            ),
-                            dbc.Col(
-                                html.Button(
-                                    [html.I(className="bi bi-arrow-clockwise me-2"), "Reset Filters"],
-                                    id="reset-filters-button", n_clicks=0,
-                                    className="btn-reset-new-theme w-100 mt-4"
+@lru_cache(maxsize=1)
+def build_dashboard_page():
+    return dbc.Col(
+        [
+            # Filters Section
+            dbc.Row(
+                dbc.Col(
+                    dbc.Card(
+                        dbc.CardBody([
+                            html.H5("Filter Your Data", className="card-title-new-theme text-center mb-3"),
+                            dbc.Row([
+                                dbc.Col(
+                                    html.Div([
+                                        html.Label("Select Month(s):", className="form-label-new-theme"),
+                                        dcc.Dropdown(
+                                            id="month-filter",
+                                            options=[],
+                                            multi=True,
+                                            placeholder="All Months",
+                                            className="dropdown-new-theme"
+                                        ),
+                                    ]),
+                                    lg=5, md=6, sm=12, className="mb-3"
                                 ),
-                                lg=2, md=12, sm=12, className="mb-3 d-flex align-items-end"
-                            )
-                        ], className="g-3 justify-content-center")
-                    ]),
-                    className="filter-card-new-theme mb-5"
-                ),
-                width=12
-            )
-        ),
-
-        # KPI Cards
-        dbc.Row([
-            dbc.Col(dbc.Card(
-                dbc.CardBody([
-                    html.P("Total Expenses", className="kpi-label-new-theme"),
-                    html.H4("₹0.00", id="total-expenses-kpi", className="kpi-value-new-theme primary-kpi"), 
-                ]), className="kpi-card-new-theme"
-            ), lg=3, md=6, sm=12, className="mb-4"),
-            dbc.Col(dbc.Card(
-                dbc.CardBody([
-                    html.P("Avg Monthly Expense", className="kpi-label-new-theme"),
-                    html.H4("₹0.00", id="avg-monthly-kpi", className="kpi-value-new-theme accent-kpi"), 
-                ]), className="kpi-card-new-theme"
-            ), lg=3, md=6, sm=12, className="mb-4"),
-            dbc.Col(dbc.Card(
-                dbc.CardBody([
-                    html.P("Highest Month", className="kpi-label-new-theme"),
-                    html.H5("N/A", id="highest-month-kpi-name", className="kpi-value-small-new-theme text-warning"),
-                    html.P("₹0.00", id="highest-month-kpi-value", className="kpi-sub-value-new-theme-small"),
-                ]), className="kpi-card-new-theme"
-            ), lg=3, md=6, sm=12, className="mb-4"),
-            dbc.Col(dbc.Card(
-                dbc.CardBody([
-                    html.P("Lowest Month", className="kpi-label-new-theme"),
-                    html.H5("N/A", id="lowest-month-kpi-name", className="kpi-value-small-new-theme text-info"),
-                    html.P("₹0.00", id="lowest-month-kpi-value", className="kpi-sub-value-new-theme-small"),
-                ]), className="kpi-card-new-theme"
-            ), lg=3, md=6, sm=12, className="mb-4"),
-        ], className="g-4 mb-5"),
-
-        # Charts Section
-        dbc.Row([
-            dbc.Col(dcc.Loading(id="loading-trend-chart", type="circle", color=CUSTOM_COLOR_PALETTE[0], children=dcc.Graph(id="monthly-expenses-trend-chart")), lg=6, md=12, className="mb-4 chart-panel-new-theme"),
-            dbc.Col(dcc.Loading(id="loading-pie-chart", type="circle", color=CUSTOM_COLOR_PALETTE[1], children=dcc.Graph(id="top-expense-categories-chart")), lg=6, md=12, className="mb-4 chart-panel-new-theme"),
-        ], className="g-4"),
-
-        dbc.Row([
-            dbc.Col(dcc.Loading(id="loading-bar-chart", type="circle", color=CUSTOM_COLOR_PALETTE[2], children=dcc.Graph(id="monthly-expenses-by-category-chart")), width=12, className="mb-4 chart-panel-new-theme"),
-        ], className="g-4"),
-
-        # Data Table Section
-        dbc.Row([
-            dbc.Col(
-                html.Div([
-                    html.H4("📊 Detailed Expense Data", className="section-title-new-theme text-center mb-4"),
-                    dcc.Loading(
-                        id="loading-overview-table", type="circle", color=CUSTOM_COLOR_PALETTE[3],
-                        children=dash_table.DataTable(
+                                dbc.Col(
+                                    html.Div([
+                                        html.Label("Select Category(s):", className="form-label-new-theme"),
+                                        dcc.Dropdown(
+                                            id="category-filter",
+                                            options=[],
+                                            multi=True,
+                                            placeholder="All Categories",
+                                            className="dropdown-new-theme"
+                                        ),
+                                    ]),
+                                    lg=5, md=6, sm=12, className="mb-3"
+                                ),
+                                dbc.Col(
+                                    html.Button(
+                                        [html.I(className="bi bi-arrow-clockwise me-2"), "Reset Filters"],
+                                        id="reset-filters-button", n_clicks=0,
+                                        className="btn-reset-new-theme w-100 mt-4"
+                                    ),
+                                    lg=2, md=12, sm=12, className="mb-3 d-flex align-items-end"
+                                )
+                            ], className="g-3 justify-content-center")
+                        ]),
+                        className="filter-card-new-theme mb-5"
+                    ),
+                    width=12
+                )
+            ),
+
+            # KPI Cards (text rendered clientside from the raw numbers in dashboard-kpis)
+            dcc.Store(id="dashboard-kpis"),
+            dbc.Row([
+                dbc.Col(dbc.Card(
+                    dbc.CardBody([
+                        html.P("Total Expenses", className="kpi-label-new-theme"),
+                        html.H4("₹0.00", id="total-expenses-kpi", className="kpi-value-new-theme primary-kpi"), 
+                    ]), className="kpi-card-new-theme"
+                ), lg=3, md=6, sm=12, className="mb-4"),
+                dbc.Col(dbc.Card(
+                    dbc.CardBody([
+                        html.P("Avg Monthly Expense", className="kpi-label-new-theme"),
+                        html.H4("₹0.00", id="avg-monthly-kpi", className="kpi-value-new-theme accent-kpi"), 
+                    ]), className="kpi-card-new-theme"
+                ), lg=3, md=6, sm=12, className="mb-4"),
+                dbc.Col(dbc.Card(
+                    dbc.CardBody([
+                        html.P("Highest Month", className="kpi-label-new-theme"),
+                        html.H5("N/A", id="highest-month-kpi-name", className="kpi-value-small-new-theme text-warning"),
+                        html.P("₹0.00", id="highest-month-kpi-value", className="kpi-sub-value-new-theme-small"),
+                    ]), className="kpi-card-new-theme"
+                ), lg=3, md=6, sm=12, className="mb-4"),
+                dbc.Col(dbc.Card(
+                    dbc.CardBody([
+                        html.P("Lowest Month", className="kpi-label-new-theme"),
+                        html.H5("N/A", id="lowest-month-kpi-name", className="kpi-value-small-new-theme text-info"),
+                        html.P("₹0.00", id="lowest-month-kpi-value", className="kpi-sub-value-new-theme-small"),
+                    ]), className="kpi-card-new-theme"
+                ), lg=3, md=6, sm=12, className="mb-4"),
+            ], className="g-4 mb-5"),
+
+            # Charts Section
+            dbc.Row([
+                dbc.Col(dcc.Graph(id="monthly-expenses-trend-chart"), lg=6, md=12, className="mb-4 chart-panel-new-theme"),
+                dbc.Col(dcc.Graph(id="top-expense-categories-chart"), lg=6, md=12, className="mb-4 chart-panel-new-theme"),
+            ], className="g-4"),
+
+            dbc.Row([
+                dbc.Col(lazy_graph("monthly-expenses-by-category-chart"), width=12, className="mb-4 chart-panel-new-theme"),
+            ], className="g-4"),
+
+            # Data Table Section
+            dbc.Row([
+                dbc.Col(
+                    html.Div([
+                        html.H4("📊 Detailed Expense Data", className="section-title-new-theme text-center mb-4"),
+                        dash_table.DataTable(
                             id="overview-data-table",
                             data=[],
                             columns=[],
@@ -441,163 +842,165 @@ dashboard_page_layout = dbc.Col(
                                 {"if": {"row_index": "odd"}, "backgroundColor": "#121212"},
                                 {"if": {"row_index": "even"}, "backgroundColor": "#1A1A1A"}, 
                             ],
-                            page_action="native",
+                            page_action="custom",
+                            page_current=0,
                             page_size=10,
                         )
-                    )
-                ], className="table-panel-new-theme p-4"),
-                width=12
-            )
-        ], className="g-4 mb-5")
-    ],
-    width=12,
-    className="main-content-new-theme"
-)
+                    ], className="table-panel-new-theme p-4"),
+                    width=12
+                )
+            ], className="g-4 mb-5")
+        ],
+        width=12,
+        className="main-content-new-theme"
+    )
 
 # --- Layout for the Savings Monitor Page ---
-savings_monitor_layout = dbc.Col(
-    [
-        dbc.Row(
-            dbc.Col(
-                html.H2("💰 Savings Monitor", className="section-title-new-theme text-center mb-4", style={'color': 'var(--accent-lime)', 'textShadow': 'var(--glow-lime)'}),
-                width=12
-            )
-        ),
-        # Filter Section for Savings Monitor
-        dbc.Row(
-            dbc.Col(
-                dbc.Card(
-                    dbc.CardBody([
-                        html.H5("Filter Your Savings Data", className="card-title-new-theme text-center mb-3"),
-                        dbc.Row([
-                            dbc.Col(
-                                html.Div([
-                                    html.Label("Select Month(s):", className="form-label-new-theme"),
-                                    dcc.Dropdown(
-                                        id="savings-month-filter",
-                                        options=[],
-                                        multi=True,
-                                        placeholder="All Months",
-                                        className="dropdown-new-theme"
-                                    ),
-                                ]),
-                                lg=5, md=6, sm=12, className="mb-3"
-                            ),
-                            dbc.Col(
-                                html.Div([
-                                    html.Label("Select Category(s):", className="form-label-new-theme"),
-                                    dcc.Dropdown(
-                                        id="savings-category-filter",
-                                        options=[],
-                                        multi=True,
-                                        placeholder="All Categories",
-                                        className="dropdown-new-theme"
-                                    ),
-                                ]),
-                                lg=5, md=6, sm=12, className="mb-3"
-                            ),
-                            dbc.Col(
-                                html.Button(
-                                    [html.I(className="bi bi-arrow-clockwise me-2"), "Reset Filters"],
-                                    id="savings-reset-filters-button", n_clicks=0,
-                                    className="btn-reset-new-theme w-100 mt-4"
+@lru_cache(maxsize=1)
+def build_savings_monitor_page():
+    return dbc.Col(
+        [
+            dbc.Row(
+                dbc.Col(
+                    html.H2("💰 Savings Monitor", className="section-title-new-theme text-center mb-4", style={'color': 'var(--accent-lime)', 'textShadow': 'var(--glow-lime)'}),
+                    width=12
+                )
+            ),
+            # Filter Section for Savings Monitor
+            dbc.Row(
+                dbc.Col(
+                    dbc.Card(
+                        dbc.CardBody([
+                            html.H5("Filter Your Savings Data", className="card-title-new-theme text-center mb-3"),
+                            dbc.Row([
+                                dbc.Col(
+                                    html.Div([
+                                        html.Label("Select Month(s):", className="form-label-new-theme"),
+                                        dcc.Dropdown(
+                                            id="savings-month-filter",
+                                            options=[],
+                                            multi=True,
+                                            placeholder="All Months",
+                                            className="dropdown-new-theme"
+                                        ),
+                                    ]),
+                                    lg=5, md=6, sm=12, className="mb-3"
                                 ),
-                                lg=2, md=12, sm=12, className="mb-3 d-flex align-items-end"
-                            )
-                        ], className="g-3 justify-content-center")
-                    ]),
-                    className="filter-card-new-theme mb-5"
-                ),
-                width=12
-            )
-        ),
-
-        dbc.Row([
-            dbc.Col(dbc.Card(
-                dbc.CardBody([
-                    html.P("Total Savings (Credit)", className="kpi-label-new-theme"),
-                    html.H4("₹0.00", id="total-savings-credit-kpi", className="kpi-value-new-theme primary-kpi", style={'color': 'var(--accent-lime)', 'textShadow': 'var(--glow-lime)'}), 
-                ]), className="kpi-card-new-theme"
-            ), lg=4, md=6, sm=12, className="mb-4"),
-            dbc.Col(dbc.Card(
-                dbc.CardBody([
-                    html.P("Total Withdrawals (Debit)", className="kpi-label-new-theme"),
-                    html.H4("₹0.00", id="total-savings-debit-kpi", className="kpi-value-new-theme accent-kpi", style={'color': 'var(--accent-magenta)', 'textShadow': 'var(--glow-magenta)'}), 
-                ]), className="kpi-card-new-theme"
-            ), lg=4, md=6, sm=12, className="mb-4"),
-            dbc.Col(dbc.Card(
-                dbc.CardBody([
-                    html.P("Net Savings", className="kpi-label-new-theme"),
-                    html.H4("₹0.00", id="net-savings-kpi", className="kpi-value-new-theme text-info", style={'color': 'var(--accent-cyan)', 'textShadow': 'var(--glow-cyan)'}), 
-                ]), className="kpi-card-new-theme"
-            ), lg=4, md=12, sm=12, className="mb-4"),
-        ], className="g-4 mb-5"),
-
-        # Savings Goal Calculator Section
-        dbc.Row([
-            dbc.Col(
-                dbc.Card(
-                    dbc.CardBody([
-                        html.H5("🎯 Savings Goal Calculator", className="card-title-new-theme text-center mb-3", style={'color': 'var(--accent-gold)', 'textShadow': 'var(--glow-gold)'}),
-                        dbc.Row([
-                            dbc.Col(
-                                html.Div([
-                                    html.Label("Target Amount (₹):", className="form-label-new-theme"),
-                                    dcc.Input(
-                                        id="target-amount-input",
-                                        type="number",
-                                        min=0,
-                                        placeholder="e.g., 50000",
-                                        className="form-control-new-theme"
-                                    ),
-                                ]),
-                                lg=4, md=6, sm=12, className="mb-3"
-                            ),
-                            dbc.Col(
-                                html.Div([
-                                    html.Label("Duration (Months):", className="form-label-new-theme"),
-                                    dcc.Input(
-                                        id="duration-input",
-                                        type="number",
-                                        min=1,
-                                        placeholder="e.g., 12",
-                                        className="form-control-new-theme"
+                                dbc.Col(
+                                    html.Div([
+                                        html.Label("Select Category(s):", className="form-label-new-theme"),
+                                        dcc.Dropdown(
+                                            id="savings-category-filter",
+                                            options=[],
+                                            multi=True,
+                                            placeholder="All Categories",
+                                            className="dropdown-new-theme"
+                                        ),
+                                    ]),
+                                    lg=5, md=6, sm=12, className="mb-3"
+                                ),
+                                dbc.Col(
+                                    html.Button(
+                                        [html.I(className="bi bi-arrow-clockwise me-2"), "Reset Filters"],
+                                        id="savings-reset-filters-button", n_clicks=0,
+                                        className="btn-reset-new-theme w-100 mt-4"
                                     ),
-                                ]),
-                                lg=4, md=6, sm=12, className="mb-3"
-                            ),
-                            dbc.Col(
-                                html.Button(
-                                    [html.I(className="bi bi-calculator me-2"), "Calculate Goal"],
-                                    id="calculate-goal-button", n_clicks=0,
-                                    className="btn-primary-new-theme w-100 mt-4"
+                                    lg=2, md=12, sm=12, className="mb-3 d-flex align-items-end"
+                                )
+                            ], className="g-3 justify-content-center")
+                        ]),
+                        className="filter-card-new-theme mb-5"
+                    ),
+                    width=12
+                )
+            ),
+
+            # KPI text is rendered clientside from the raw numbers in savings-kpis
+            dcc.Store(id="savings-kpis"),
+            dbc.Row([
+                dbc.Col(dbc.Card(
+                    dbc.CardBody([
+                        html.P("Total Savings (Credit)", className="kpi-label-new-theme"),
+                        html.H4("₹0.00", id="total-savings-credit-kpi", className="kpi-value-new-theme primary-kpi", style={'color': 'var(--accent-lime)', 'textShadow': 'var(--glow-lime)'}), 
+                    ]), className="kpi-card-new-theme"
+                ), lg=4, md=6, sm=12, className="mb-4"),
+                dbc.Col(dbc.Card(
+                    dbc.CardBody([
+                        html.P("Total Withdrawals (Debit)", className="kpi-label-new-theme"),
+                        html.H4("₹0.00", id="total-savings-debit-kpi", className="kpi-value-new-theme accent-kpi", style={'color': 'var(--accent-magenta)', 'textShadow': 'var(--glow-magenta)'}), 
+                    ]), className="kpi-card-new-theme"
+                ), lg=4, md=6, sm=12, className="mb-4"),
+                dbc.Col(dbc.Card(
+                    dbc.CardBody([
+                        html.P("Net Savings", className="kpi-label-new-theme"),
+                        html.H4("₹0.00", id="net-savings-kpi", className="kpi-value-new-theme text-info", style={'color': 'var(--accent-cyan)', 'textShadow': 'var(--glow-cyan)'}), 
+                    ]), className="kpi-card-new-theme"
+                ), lg=4, md=12, sm=12, className="mb-4"),
+            ], className="g-4 mb-5"),
+
+            # Savings Goal Calculator Section
+            dbc.Row([
+                dbc.Col(
+                    dbc.Card(
+                        dbc.CardBody([
+                            html.H5("🎯 Savings Goal Calculator", className="card-title-new-theme text-center mb-3", style={'color': 'var(--accent-gold)', 'textShadow': 'var(--glow-gold)'}),
+                            dbc.Row([
+                                dbc.Col(
+                                    html.Div([
+                                        html.Label("Target Amount (₹):", className="form-label-new-theme"),
+                                        dcc.Input(
+                                            id="target-amount-input",
+                                            type="number",
+                                            min=0,
+                                            placeholder="e.g., 50000",
+                                            className="form-control-new-theme"
+                                        ),
+                                    ]),
+                                    lg=4, md=6, sm=12, className="mb-3"
                                 ),
-                                lg=4, md=12, sm=12, className="mb-3 d-flex align-items-end"
-                            )
-                        ], className="g-3 justify-content-center"),
-                        html.Div(id="savings-goal-output", className="text-center mt-3 kpi-sub-value-new-theme-small", style={'color': 'var(--accent-chartreuse)', 'textShadow': 'var(--glow-chartreuse)'})
-                    ]),
-                    className="filter-card-new-theme mb-5"
-                ),
-                width=12
-            )
-        ]),
-
-        dbc.Row([
-            dbc.Col(dcc.Loading(id="loading-savings-trend", type="circle", color=CUSTOM_COLOR_PALETTE[0], children=dcc.Graph(id="savings-monthly-trend-chart")), width=12, className="mb-4 chart-panel-new-theme"),
-        ], className="g-4"),
-
-        dbc.Row([
-            dbc.Col(dcc.Loading(id="loading-savings-category", type="circle", color=CUSTOM_COLOR_PALETTE[1], children=dcc.Graph(id="savings-category-bar-chart")), width=12, className="mb-4 chart-panel-new-theme"),
-        ], className="g-4"),
-
-        dbc.Row([
-            dbc.Col(
-                html.Div([
-                    html.H4("📊 Detailed Savings Transactions", className="section-title-new-theme text-center mb-4", style={'color': 'var(--accent-gold)', 'textShadow': 'var(--glow-gold)'}),
-                    dcc.Loading(
-                        id="loading-savings-table", type="circle", color=CUSTOM_COLOR_PALETTE[3],
-                        children=dash_table.DataTable(
+                                dbc.Col(
+                                    html.Div([
+                                        html.Label("Duration (Months):", className="form-label-new-theme"),
+                                        dcc.Input(
+                                            id="duration-input",
+                                            type="number",
+                                            min=1,
+                                            placeholder="e.g., 12",
+                                            className="form-control-new-theme"
+                                        ),
+                                    ]),
+                                    lg=4, md=6, sm=12, className="mb-3"
+                                ),
+                                dbc.Col(
+                                    html.Button(
+                                        [html.I(className="bi bi-calculator me-2"), "Calculate Goal"],
+                                        id="calculate-goal-button", n_clicks=0,
+                                        className="btn-primary-new-theme w-100 mt-4"
+                                    ),
+                                    lg=4, md=12, sm=12, className="mb-3 d-flex align-items-end"
+                                )
+                            ], className="g-3 justify-content-center"),
+                            html.Div(id="savings-goal-output", className="text-center mt-3 kpi-sub-value-new-theme-small", style={'color': 'var(--accent-chartreuse)', 'textShadow': 'var(--glow-chartreuse)'})
+                        ]),
+                        className="filter-card-new-theme mb-5"
+                    ),
+                    width=12
+                )
+            ]),
+
+            dbc.Row([
+                dbc.Col(dcc.Graph(id="savings-monthly-trend-chart"), width=12, className="mb-4 chart-panel-new-theme"),
+            ], className="g-4"),
+
+            dbc.Row([
+                dbc.Col(lazy_graph("savings-category-bar-chart"), width=12, className="mb-4 chart-panel-new-theme"),
+            ], className="g-4"),
+
+            dbc.Row([
+                dbc.Col(
+                    html.Div([
+                        html.H4("📊 Detailed Savings Transactions", className="section-title-new-theme text-center mb-4", style={'color': 'var(--accent-gold)', 'textShadow': 'var(--glow-gold)'}),
+                        dash_table.DataTable(
                             id="savings-data-table",
                             data=[],
                             columns=[],
@@ -609,146 +1012,147 @@ savings_monitor_layout = dbc.Col(
                                 {"if": {"row_index": "odd"}, "backgroundColor": "#121212"},
                                 {"if": {"row_index": "even"}, "backgroundColor": "#1A1A1A"}, 
                             ],
-                            page_action="native",
+                            page_action="custom",
+                            page_current=0,
                             page_size=10,
                         )
-                    )
-                ], className="table-panel-new-theme p-4"),
-                width=12
-            )
-        ], className="g-4 mb-5")
-    ],
-    width=12,
-    className="main-content-new-theme"
-)
+                    ], className="table-panel-new-theme p-4"),
+                    width=12
+                )
+            ], className="g-4 mb-5")
+        ],
+        width=12,
+        className="main-content-new-theme"
+    )
 # --- Layout for the Investments Page ---
-investments_layout = dbc.Col(
-    [
-        dbc.Row(
-            dbc.Col(
-                html.H2("💰 Investments", className="section-title-new-theme text-center mb-4", style={'color': 'var(--accent-gold)', 'textShadow': 'var(--glow-gold)'}),
-                width=12
-            )
-        ),
-        # Filter Section for Investments
-        dbc.Row(
-            dbc.Col(
-                dbc.Card(
-                    dbc.CardBody([
-                        html.H5("Filter Your Investment Data", className="card-title-new-theme text-center mb-3"),
-                        dbc.Row([
-                            dbc.Col(
-                                html.Div([
-                                    html.Label("Select Month(s):", className="form-label-new-theme"),
-                                    dcc.Dropdown(
-                                        id="investments-month-filter",
-                                        options=[],
-                                        multi=True,
-                                        placeholder="All Months",
-                                        className="dropdown-new-theme"
-                                    ),
-                                ]),
-                                lg=5, md=6, sm=12, className="mb-3"
-                            ),
-                            dbc.Col(
-                                html.Div([
-                                    html.Label("Select Category(s):", className="form-label-new-theme"),
-                                    dcc.Dropdown(
-                                        id="investments-category-filter",
-                                        options=[],
-                                        multi=True,
-                                        placeholder="All Categories",
-                                        className="dropdown-new-theme"
-                                    ),
-                                ]),
-                                lg=5, md=6, sm=12, className="mb-3"
-                            ),
-                            dbc.Col(
-                                html.Button(
-                                    [html.I(className="bi bi-arrow-clockwise me-2"), "Reset Filters"],
-                                    id="investments-reset-filters-button", n_clicks=0,
-                                    className="btn-reset-new-theme w-100 mt-4"
+@lru_cache(maxsize=1)
+def build_investments_page():
+    return dbc.Col(
+        [
+            dbc.Row(
+                dbc.Col(
+                    html.H2("💰 Investments", className="section-title-new-theme text-center mb-4", style={'color': 'var(--accent-gold)', 'textShadow': 'var(--glow-gold)'}),
+                    width=12
+                )
+            ),
+            # Filter Section for Investments
+            dbc.Row(
+                dbc.Col(
+                    dbc.Card(
+                        dbc.CardBody([
+                            html.H5("Filter Your Investment Data", className="card-title-new-theme text-center mb-3"),
+                            dbc.Row([
+                                dbc.Col(
+                                    html.Div([
+                                        html.Label("Select Month(s):", className="form-label-new-theme"),
+                                        dcc.Dropdown(
+                                            id="investments-month-filter",
+                                            options=[],
+                                            multi=True,
+                                            placeholder="All Months",
+                                            className="dropdown-new-theme"
+                                        ),
+                                    ]),
+                                    lg=5, md=6, sm=12, className="mb-3"
                                 ),
-                                lg=2, md=12, sm=12, className="mb-3 d-flex align-items-end"
-                            )
-                        ], className="g-3 justify-content-center")
-                    ]),
-                    className="filter-card-new-theme mb-5"
-                ),
-                width=12
-            )
-        ),
-
-        # KPI Cards for Investments
-        dbc.Row([
-            dbc.Col(dbc.Card(
-                dbc.CardBody([
-                    html.P("Total Investments", className="kpi-label-new-theme"),
-                    html.H4("₹0.00", id="total-investments-kpi", className="kpi-value-new-theme primary-kpi", style={'color': 'var(--accent-gold)', 'textShadow': 'var(--glow-gold)'}),
-                ]), className="kpi-card-new-theme"
-            ), lg=3, md=6, sm=12, className="mb-4"),
-            dbc.Col(dbc.Card(
-                dbc.CardBody([
-                    html.P("Avg Monthly Investment", className="kpi-label-new-theme"),
-                    html.H4("₹0.00", id="avg-monthly-investment-kpi", className="kpi-value-new-theme accent-kpi", style={'color': 'var(--accent-cyan)', 'textShadow': 'var(--glow-cyan)'}),
-                ]), className="kpi-card-new-theme"
-            ), lg=3, md=6, sm=12, className="mb-4"),
-            dbc.Col(dbc.Card(
-                dbc.CardBody([
-                    html.P("Highest Investment Category", className="kpi-label-new-theme"),
-                    html.H5("N/A", id="highest-category-kpi-name", className="kpi-value-small-new-theme text-warning"),
-                    html.P("₹0.00", id="highest-category-kpi-value", className="kpi-sub-value-new-theme-small"),
-                ]), className="kpi-card-new-theme"
-            ), lg=3, md=6, sm=12, className="mb-4"),
-            dbc.Col(dbc.Card(
-                dbc.CardBody([
-                    html.P("Lowest Investment Category", className="kpi-label-new-theme"),
-                    html.H5("N/A", id="lowest-category-kpi-name", className="kpi-value-small-new-theme text-info"),
-                    html.P("₹0.00", id="lowest-category-kpi-value", className="kpi-sub-value-new-theme-small"),
-                ]), className="kpi-card-new-theme"
-            ), lg=3, md=6, sm=12, className="mb-4"),
-        ], className="g-4 mb-5"),
-
-        # New KPI Row for remaining installments
-        dbc.Row([
-            dbc.Col(dbc.Card(
-                dbc.CardBody([
-                    html.P("LIC Installments Left", className="kpi-label-new-theme"),
-                    html.H4("N/A", id="lic-installments-kpi", className="kpi-value-new-theme text-info"),
-                ]), className="kpi-card-new-theme"
-            ), lg=4, md=6, sm=12, className="mb-4"),
-            dbc.Col(dbc.Card(
-                dbc.CardBody([
-                    html.P("Kumaran Installments Left", className="kpi-label-new-theme"),
-                    html.H4("N/A", id="kumaran-installments-kpi", className="kpi-value-new-theme text-info"),
-                ]), className="kpi-card-new-theme"
-            ), lg=4, md=6, sm=12, className="mb-4"),
-            dbc.Col(dbc.Card(
-                dbc.CardBody([
-                    html.P("Thangamayil Installments Left", className="kpi-label-new-theme"),
-                    html.H4("N/A", id="thangamayil-installments-kpi", className="kpi-value-new-theme text-info"),
-                ]), className="kpi-card-new-theme"
-            ), lg=4, md=6, sm=12, className="mb-4"),
-        ], className="g-4 mb-5"),
-        
-        # Charts Section for Investments
-        dbc.Row([
-            dbc.Col(dcc.Loading(id="loading-investments-trend", type="circle", color=CUSTOM_COLOR_PALETTE[0], children=dcc.Graph(id="investments-monthly-trend-chart")), lg=6, md=12, className="mb-4 chart-panel-new-theme"),
-            dbc.Col(dcc.Loading(id="loading-investments-pie", type="circle", color=CUSTOM_COLOR_PALETTE[1], children=dcc.Graph(id="investments-by-category-pie-chart")), lg=6, md=12, className="mb-4 chart-panel-new-theme"),
-        ], className="g-4"),
-
-        dbc.Row([
-            dbc.Col(dcc.Loading(id="loading-investments-bar", type="circle", color=CUSTOM_COLOR_PALETTE[2], children=dcc.Graph(id="monthly-investments-by-category-chart")), width=12, className="mb-4 chart-panel-new-theme"),
-        ], className="g-4"),
-        
-        # Data Table for Investments
-        dbc.Row([
-            dbc.Col(
-                html.Div([
-                    html.H4("📊 Detailed Investment Data", className="section-title-new-theme text-center mb-4"),
-                    dcc.Loading(
-                        id="loading-investments-table", type="circle", color=CUSTOM_COLOR_PALETTE[3],
-                        children=dash_table.DataTable(
+                                dbc.Col(
+                                    html.Div([
+                                        html.Label("Select Category(s):", className="form-label-new-theme"),
+                                        dcc.Dropdown(
+                                            id="investments-category-filter",
+                                            options=[],
+                                            multi=True,
+                                            placeholder="All Categories",
+                                            className="dropdown-new-theme"
+                                        ),
+                                    ]),
+                                    lg=5, md=6, sm=12, className="mb-3"
+                                ),
+                                dbc.Col(
+                                    html.Button(
+                                        [html.I(className="bi bi-arrow-clockwise me-2"), "Reset Filters"],
+                                        id="investments-reset-filters-button", n_clicks=0,
+                                        className="btn-reset-new-theme w-100 mt-4"
+                                    ),
+                                    lg=2, md=12, sm=12, className="mb-3 d-flex align-items-end"
+                                )
+                            ], className="g-3 justify-content-center")
+                        ]),
+                        className="filter-card-new-theme mb-5"
+                    ),
+                    width=12
+                )
+            ),
+
+            # KPI Cards for Investments (text rendered clientside from investments-kpis)
+            dcc.Store(id="investments-kpis"),
+            dbc.Row([
+                dbc.Col(dbc.Card(
+                    dbc.CardBody([
+                        html.P("Total Investments", className="kpi-label-new-theme"),
+                        html.H4("₹0.00", id="total-investments-kpi", className="kpi-value-new-theme primary-kpi", style={'color': 'var(--accent-gold)', 'textShadow': 'var(--glow-gold)'}),
+                    ]), className="kpi-card-new-theme"
+                ), lg=3, md=6, sm=12, className="mb-4"),
+                dbc.Col(dbc.Card(
+                    dbc.CardBody([
+                        html.P("Avg Monthly Investment", className="kpi-label-new-theme"),
+                        html.H4("₹0.00", id="avg-monthly-investment-kpi", className="kpi-value-new-theme accent-kpi", style={'color': 'var(--accent-cyan)', 'textShadow': 'var(--glow-cyan)'}),
+                    ]), className="kpi-card-new-theme"
+                ), lg=3, md=6, sm=12, className="mb-4"),
+                dbc.Col(dbc.Card(
+                    dbc.CardBody([
+                        html.P("Highest Investment Category", className="kpi-label-new-theme"),
+                        html.H5("N/A", id="highest-category-kpi-name", className="kpi-value-small-new-theme text-warning"),
+                        html.P("₹0.00", id="highest-category-kpi-value", className="kpi-sub-value-new-theme-small"),
+                    ]), className="kpi-card-new-theme"
+                ), lg=3, md=6, sm=12, className="mb-4"),
+                dbc.Col(dbc.Card(
+                    dbc.CardBody([
+                        html.P("Lowest Investment Category", className="kpi-label-new-theme"),
+                        html.H5("N/A", id="lowest-category-kpi-name", className="kpi-value-small-new-theme text-info"),
+                        html.P("₹0.00", id="lowest-category-kpi-value", className="kpi-sub-value-new-theme-small"),
+                    ]), className="kpi-card-new-theme"
+                ), lg=3, md=6, sm=12, className="mb-4"),
+            ], className="g-4 mb-5"),
+
+            # New KPI Row for remaining installments
+            dbc.Row([
+                dbc.Col(dbc.Card(
+                    dbc.CardBody([
+                        html.P("LIC Installments Left", className="kpi-label-new-theme"),
+                        html.H4("N/A", id="lic-installments-kpi", className="kpi-value-new-theme text-info"),
+                    ]), className="kpi-card-new-theme"
+                ), lg=4, md=6, sm=12, className="mb-4"),
+                dbc.Col(dbc.Card(
+                    dbc.CardBody([
+                        html.P("Kumaran Installments Left", className="kpi-label-new-theme"),
+                        html.H4("N/A", id="kumaran-installments-kpi", className="kpi-value-new-theme text-info"),
+                    ]), className="kpi-card-new-theme"
+                ), lg=4, md=6, sm=12, className="mb-4"),
+                dbc.Col(dbc.Card(
+                    dbc.CardBody([
+                        html.P("Thangamayil Installments Left", className="kpi-label-new-theme"),
+                        html.H4("N/A", id="thangamayil-installments-kpi", className="kpi-value-new-theme text-info"),
+                    ]), className="kpi-card-new-theme"
+                ), lg=4, md=6, sm=12, className="mb-4"),
+            ], className="g-4 mb-5"),
+            
+            # Charts Section for Investments
+            dbc.Row([
+                dbc.Col(dcc.Graph(id="investments-monthly-trend-chart"), lg=6, md=12, className="mb-4 chart-panel-new-theme"),
+                dbc.Col(dcc.Graph(id="investments-by-category-pie-chart"), lg=6, md=12, className="mb-4 chart-panel-new-theme"),
+            ], className="g-4"),
+
+            dbc.Row([
+                dbc.Col(lazy_graph("monthly-investments-by-category-chart"), width=12, className="mb-4 chart-panel-new-theme"),
+            ], className="g-4"),
+            
+            # Data Table for Investments
+            dbc.Row([
+                dbc.Col(
+                    html.Div([
+                        html.H4("📊 Detailed Investment Data", className="section-title-new-theme text-center mb-4"),
+                        dash_table.DataTable(
                             id="investments-data-table",
                             data=[],
                             columns=[],
@@ -760,33 +1164,287 @@ investments_layout = dbc.Col(
                                 {"if": {"row_index": "odd"}, "backgroundColor": "#121212"},
                                 {"if": {"row_index": "even"}, "backgroundColor": "#1A1A1A"},
                             ],
-                            page_action="native",
+                            page_action="custom",
+                            page_current=0,
                             page_size=10,
                         )
-                    )
-                ], className="table-panel-new-theme p-4"),
-                width=12
-            )
-        ], className="g-4 mb-5")
+                    ], className="table-panel-new-theme p-4"),
+                    width=12
+                )
+            ], className="g-4 mb-5")
+        ],
+        width=12,
+        className="main-content-new-theme"
+    )
+# --- dcc.Store (de)serialization ---
+# DataFrames travel between callbacks as a base64 Arrow IPC stream:
+#   {"arrow": <base64 IPC bytes>,
+#    "options": {key column: [distinct values in category order]}, "columns": [names]}
+# Amounts travel as integer paise (int32 unless a value needs int64), which is
+# exact and compresses better than float bits, and Month/Category stay
+# dictionary-encoded, so the payload is compact and decoding is a columnar
+# read with no per-cell Python objects for the numeric columns.
+# The filter dropdown values are computed once here, at load time.
+def df_to_store(df):
+    if df.empty:
+        return None
+    table = amounts_to_paise(pa.Table.from_pandas(df, preserve_index=False), df)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    options = {col: df[col].astype("category").cat.categories.tolist() for col in KEY_COLUMNS if col in df.columns}
+    return {
+        "arrow": base64.b64encode(sink.getvalue()).decode("ascii"),
+        "options": options,
+        "columns": df.columns.tolist(),
+    }
+
+def amounts_to_paise(table, df):
+    for col in AMOUNT_COLUMNS:
+        if col not in df.columns:
+            continue
+        rupees = df[col].to_numpy(dtype="float64")
+        missing = np.isnan(rupees)
+        paise = np.rint(np.where(missing, 0, rupees) * 100)
+        dtype = np.int32 if np.abs(paise).max(initial=0) < 2 ** 31 else np.int64
+        table = table.set_column(
+            table.schema.get_field_index(col), col, pa.array(paise.astype(dtype), mask=missing)
+        )
+    return table
+
+# Only integer amount columns are paise; float ones (Parquet cache, stores
+# written before the paise encoding) are already in rupees.
+def amounts_from_paise(table):
+    for col in AMOUNT_COLUMNS:
+        i = table.schema.get_field_index(col)
+        if i >= 0 and pa.types.is_integer(table.schema.field(i).type):
+            table = table.set_column(i, col, pc.divide(pc.cast(table.column(i), pa.float64()), 100.0))
+    return table
+
+# --- Clientside outputs ---
+# Dropdown options, table columns and KPI text are rendered in the browser
+# (assets/clientside.js): options and columns straight from the store
+# payload, KPIs from the raw numbers the page callbacks put in a small
+# per-page store. Neither needs a server round trip of its own.
+def amount_kpis(total, average, highest_name, highest_value, lowest_name, lowest_value):
+    return {
+        "total": float(total),
+        "average": float(average),
+        "highest": [str(highest_name), float(highest_value)],
+        "lowest": [str(lowest_name), float(lowest_value)],
+    }
+
+# Arrow string columns decode straight into Arrow-backed pandas strings.
+# split_blocks keeps one block per column instead of consolidating them into
+# 2-D blocks, so the numeric columns are wrapped without an extra copy.
+STORE_TYPES = {pa.string(): ARROW_STRING, pa.large_string(): ARROW_STRING}
+
+def frame_from_arrow(table):
+    return categorize_keys(downcast_amounts(table.to_pandas(types_mapper=STORE_TYPES.get, split_blocks=True)))
+
+def df_from_store(store):
+    return frame_from_arrow(amounts_from_paise(pa.ipc.open_stream(base64.b64decode(store["arrow"])).read_all()))
+
+# --- Decoded store cache and filter row indexes ---
+# Dash re-sends the whole store with every callback, so each payload is decoded
+# once and cached under a digest of its Arrow bytes. The digest is computed
+# here on the server: the caches are shared by every session, so a key taken
+# from the client could pin another payload's frame and figures to it.
+# Hashing the base64 text is far cheaper than decoding it.
+# Each Month/Category value is also mapped to the sorted row positions holding
+# it, so applying a filter costs O(matching rows) instead of an isin() scan.
+# Frames returned from here are shared between callbacks and must not be mutated.
+def store_digest(store):
+    return hashlib.blake2b(store["arrow"].encode("ascii"), digest_size=16).hexdigest()
+
+def store_key(store, *args):
+    return (store_digest(store),) + args
+
+@cached(LRUCache(maxsize=8), key=store_key, lock=Lock())
+def load_store_frame(store):
+    return df_from_store(store)
+
+@cached(LRUCache(maxsize=16), key=store_key, lock=Lock())
+def build_row_index(store, column):
+    return load_store_frame(store).groupby(column, sort=False, observed=True).indices
+
+# --- Month x Category amount cube ---
+# Totals of one amount column and row counts per (Month, Category), built once
+# per store version and column.
+# Both keys are categorical, so their codes index a dense grid directly and are
+# accumulated with a single bincount pass, rather than a hashed groupby + unstack.
+# Every summary a page needs is then a slice of the cube plus an axis sum,
+# instead of fresh groupbys over the filtered rows on each interaction.
+@cached(LRUCache(maxsize=8), key=store_key, lock=Lock())
+def build_amount_cube(store, column="Amount"):
+    df = load_store_frame(store)
+    month_codes, months = df["Month"].cat.codes.to_numpy(dtype=np.intp), df["Month"].cat.categories
+    category_codes, categories = df["Category"].cat.codes.to_numpy(dtype=np.intp), df["Category"].cat.categories
+    shape = (len(months), len(categories))
+    # Code -1 marks a missing Month/Category; such rows belong to no cell and
+    # would otherwise wrap into a neighbouring one (or make bincount raise)
+    known = (month_codes >= 0) & (category_codes >= 0)
+    cells = month_codes[known] * shape[1] + category_codes[known]
+    amount_sums = np.bincount(cells, weights=df[column].to_numpy()[known], minlength=shape[0] * shape[1])
+    row_counts = np.bincount(cells, minlength=shape[0] * shape[1])
+    index = pd.Index(months, name="Month")
+    columns = pd.Index(categories, name="Category")
+    return (
+        pd.DataFrame(amount_sums.reshape(shape), index=index, columns=columns),
+        pd.DataFrame(row_counts.reshape(shape), index=index, columns=columns),
+    )
+
+def slice_cube(store, selected_months, selected_categories, column="Amount"):
+    amount_sums, row_counts = build_amount_cube(store, column)
+    month_mask = amount_sums.index.isin(selected_months) if selected_months else slice(None)
+    category_mask = amount_sums.columns.isin(selected_categories) if selected_categories else slice(None)
+    return amount_sums.loc[month_mask, category_mask], row_counts.loc[month_mask, category_mask]
+
+def summarize_from_cube(store, selected_months, selected_categories):
+    sums, counts = slice_cube(store, selected_months, selected_categories)
+    # Drop groups with no rows so summaries match a groupby over the filtered rows
+    monthly_summary = sums.sum(axis=1)[counts.sum(axis=1) > 0].rename("Amount").reset_index()
+    category_summary = sums.sum(axis=0)[counts.sum(axis=0) > 0].rename("Amount").reset_index()
+    monthly_category_summary = sums.stack()[counts.stack() > 0].rename("Amount").reset_index()
+    return monthly_summary, category_summary, monthly_category_summary
+
+# Row positions matching the filters, or None when nothing is filtered
+def select_positions(store, selected_months, selected_categories):
+    selections = []
+    for column, selected in (("Month", selected_months), ("Category", selected_categories)):
+        if selected:
+            row_index = build_row_index(store, column)
+            hits = [row_index[value] for value in selected if value in row_index]
+            selections.append(np.unique(np.concatenate(hits)) if hits else np.empty(0, dtype=np.intp))
+    if not selections:
+        return None
+    rows = selections[0]
+    if len(selections) == 2:
+        rows = np.intersect1d(selections[0], selections[1], assume_unique=True)
+    return rows
+
+def select_rows(store, selected_months, selected_categories):
+    df = load_store_frame(store)
+    rows = select_positions(store, selected_months, selected_categories)
+    return df if rows is None else df.iloc[rows]
+
+# --- Pre-sorted category groups ---
+# Rows are ordered by Category code once per store version. A per-category
+# sum over any subset of rows is then one np.add.reduceat over the masked,
+# pre-sorted values, with no hashing or sorting on the interaction path.
+@cached(LRUCache(maxsize=8), key=store_key, lock=Lock())
+def category_groups(store):
+    codes = load_store_frame(store)["Category"].cat.codes.to_numpy()
+    order = np.argsort(codes, kind="stable")
+    sorted_codes = codes[order]
+    group_starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+    return order, group_starts, sorted_codes[group_starts]
+
+def category_sums(store, values, keep):
+    order, group_starts, group_codes = category_groups(store)
+    sums = np.add.reduceat(np.where(keep, values, 0.0)[order], group_starts)
+    hits = np.add.reduceat(keep[order].astype(np.intp), group_starts)
+    # Only categories with contributing rows; code -1 marks a missing Category
+    present = (hits > 0) & (group_codes >= 0)
+    categories = load_store_frame(store)["Category"].cat.categories
+    return categories[group_codes[present]], sums[present]
+
+# Filter values as a hashable, order-independent cache key.
+def filter_key(selected):
+    return tuple(sorted(selected)) if selected else ()
+
+# --- Partial figure updates ---
+# A filter change keeps each chart's layout and template, so only the traces
+# are sent back as a Patch. Full figures are sent when the store changes or
+# the page is first rendered, since the graph may not hold a figure yet.
+# Empty filter results are sent as empty_figure()s, never {}, so the figure
+# a Patch lands on always has its layout.
+def is_filter_update(store_prop):
+    triggered = callback_context.triggered_prop_ids
+    return bool(triggered) and store_prop not in triggered
+
+def patch_figures(outputs, positions):
+    outputs = list(outputs)
+    for i in positions:
+        patch = Patch()
+        patch["data"] = outputs[i].to_plotly_json()["data"] if outputs[i] else []
+        outputs[i] = patch
+    return tuple(outputs)
+
+# --- Server-side table paging ---
+# Tables use page_action="custom": only the rows of the visible page are
+# converted to records and shipped, not the whole filtered frame.
+def table_page(filtered_df, page_current, page_size):
+    start = (page_current or 0) * page_size
+    page_count = max(1, -(-len(filtered_df) // page_size))
+    page = filtered_df.iloc[start:start + page_size]
+    # Amounts carry at most paise; rounding keeps float32 noise out of the table
+    page = page.assign(**{
+        col: np.round(page[col].to_numpy(dtype="float64"), 2) for col in AMOUNT_COLUMNS if col in page.columns
+    })
+    return page.to_dict('records'), page_count
+
+# --- Callbacks ---
+
+# Runs in the web process, so each poll reuses that worker's authorized client
+# and keep-alive connection: one Drive metadata request, and no background job
+# at all when nothing changed. The Refresh Data button always forces a load.
+@app.callback(
+    Output('sheet-load-request', 'data'),
+    [
+        Input('interval-component', 'n_intervals'),
+        Input('refresh-data-button', 'n_clicks')
     ],
-    width=12,
-    className="main-content-new-theme"
+    [State('sheet-revision', 'data')]
 )
-# --- Callbacks ---
+def check_sheet_revision(n, refresh_clicks, known_revision):
+    force = "refresh-data-button.n_clicks" in callback_context.triggered_prop_ids
+    revision = get_sheet_revision()
+    if not force and revision is not None and revision == known_revision:
+        return no_update
+    # requested_at makes a repeated request (e.g. a second forced refresh) a new value
+    return {"revision": revision, "force": force, "requested_at": time.time()}
 
 @app.callback(
     [
         Output('stored-icic-data', 'data'),
         Output('stored-canara-data', 'data'),
         Output('stored-investments-data', 'data'),
+        Output('stored-investments-precomp', 'data'),
         Output('loading-error-message', 'data'),
-        Output('data-load-status', 'children')
+        Output('data-load-status', 'children'),
+        Output('sheet-revision', 'data')
+    ],
+    [Input('sheet-load-request', 'data')],
+    prevent_initial_call=True,
+    background=True,
+    running=[
+        (Output('data-load-progress', 'style'), {"display": "block"}, {"display": "none"}),
+        # One load at a time per tab; extra clicks would only queue more jobs
+        (Output('refresh-data-button', 'disabled'), True, False)
     ],
-    [Input('interval-component', 'n_intervals')]
+    # Cleared once the job finishes, so the next load never reveals the
+    # previous load's text before its own progress arrives
+    progress=[Output('data-load-progress', 'children')],
+    progress_default=[None]
 )
-def load_and_store_data(n):
+def load_and_store_data(set_progress, load_request):
+    revision, force = load_request["revision"], load_request["force"]
+    set_progress([html.Div(
+        [
+            html.I(className="bi bi-hourglass-split me-2"),
+            "Loading new data from Google Sheets..."
+        ],
+        className="data-load-alert alert-info"
+    )])
     start_time = time.time()
-    df_icic, df_canara, df_investments, error_msg = load_data_from_google_sheets()
+    if revision is None:
+        stores, installments_left, error_msg = load_snapshot(revision, force)
+    else:
+        # Sessions polling the same new revision queue on a cross-process lock,
+        # so one of them fetches and parses while the rest reuse its snapshot
+        with diskcache.Lock(background_cache, ("sheets-load", revision), expire=SNAPSHOT_LOCK_SECONDS):
+            stores, installments_left, error_msg = load_snapshot(revision, force)
     end_time = time.time()
     
     elapsed_time = end_time - start_time
@@ -800,7 +1458,7 @@ def load_and_store_data(n):
             ],
             className="data-load-alert alert-danger"
         )
-        return df_icic.to_dict('records'), df_canara.to_dict('records'), df_investments.to_dict('records'), error_msg, status_message
+        return stores + (installments_left, error_msg, status_message, None)
     
     
     status_message = html.Div(
@@ -811,7 +1469,20 @@ def load_and_store_data(n):
         className="data-load-alert alert-success"
     )
 
-    return df_icic.to_dict('records'), df_canara.to_dict('records'), df_investments.to_dict('records'), None, status_message
+    return stores + (installments_left, None, status_message, revision)
+
+# Another session may already have loaded this revision; background jobs run
+# in their own processes, so the snapshot is shared through the disk cache
+def load_snapshot(revision, force):
+    snapshot = background_cache.get(("sheets-snapshot", revision)) if revision is not None and not force else None
+    if snapshot is not None:
+        return snapshot[:3], snapshot[3], None
+    df_icic, df_canara, df_investments, error_msg = load_data_from_google_sheets(revision, force)
+    stores = (df_to_store(df_icic), df_to_store(df_canara), df_to_store(df_investments))
+    installments_left = compute_installments_left(df_investments)
+    if revision is not None and not error_msg:
+        background_cache.set(("sheets-snapshot", revision), stores + (installments_left,), expire=SNAPSHOT_TTL_SECONDS)
+    return stores, installments_left, error_msg
 
 # Callback to render different pages based on URL
 @app.callback(
@@ -820,23 +1491,43 @@ def load_and_store_data(n):
 )
 def render_page_content(pathname):
     if pathname == '/savings':
-        return savings_monitor_layout
+        return build_savings_monitor_page()
     elif pathname == '/investments':
-        return investments_layout
+        return build_investments_page()
     else:
-        return dashboard_page_layout
+        return build_dashboard_page()
 
 # --- Dashboard Callbacks ---
 
-@app.callback(
+app.clientside_callback(
+    ClientsideFunction(namespace="dashboard", function_name="filterOutputs"),
     [
         Output("month-filter", "options"),
         Output("category-filter", "options"),
-        Output("monthly-expenses-trend-chart", "figure"),
-        Output("top-expense-categories-chart", "figure"),
-        Output("monthly-expenses-by-category-chart", "figure"),
-        Output("overview-data-table", "data"),
-        Output("overview-data-table", "columns"),
+        Output("overview-data-table", "columns")
+    ],
+    [Input("stored-icic-data", "data")]
+)
+
+# Reset clears the dropdown values themselves, so the charts, KPIs and every
+# table page read the same (empty) filters from then on
+app.clientside_callback(
+    ClientsideFunction(namespace="dashboard", function_name="resetFilters"),
+    [
+        Output("month-filter", "value"),
+        Output("category-filter", "value")
+    ],
+    [Input("reset-filters-button", "n_clicks")],
+    [
+        State("month-filter", "value"),
+        State("category-filter", "value")
+    ],
+    prevent_initial_call=True
+)
+
+app.clientside_callback(
+    ClientsideFunction(namespace="dashboard", function_name="amountKpis"),
+    [
         Output("total-expenses-kpi", "children"),
         Output("avg-monthly-kpi", "children"),
         Output("highest-month-kpi-name", "children"),
@@ -844,153 +1535,160 @@ def render_page_content(pathname):
         Output("lowest-month-kpi-name", "children"),
         Output("lowest-month-kpi-value", "children")
     ],
+    [Input("dashboard-kpis", "data")]
+)
+
+@app.callback(
+    [
+        Output("monthly-expenses-trend-chart", "figure"),
+        Output("top-expense-categories-chart", "figure"),
+        Output("monthly-expenses-by-category-chart-figure", "data"),
+        Output("overview-data-table", "page_current"),
+        Output("dashboard-kpis", "data")
+    ],
     [
         Input("stored-icic-data", "data"),
         Input("month-filter", "value"),
-        Input("category-filter", "value"),
-        Input("reset-filters-button", "n_clicks")
+        Input("category-filter", "value")
     ]
 )
-def update_dashboard(icic_data, selected_months, selected_categories, reset_clicks):
+def update_dashboard(icic_data, selected_months, selected_categories):
     if not icic_data:
         # Return empty data for all outputs if no data is available
-        return (
-            [], [], {}, {}, {}, [], [],
-            "₹0.00", "₹0.00", "N/A", "₹0.00", "N/A", "₹0.00"
-        )
+        return {}, {}, {}, 0, None
 
-    df = pd.DataFrame(icic_data)
-    
-    # Check if a new reset click occurred
-    if reset_clicks > 0:
-        selected_months = []
-        selected_categories = []
-    
-    month_options = [{"label": m, "value": m} for m in sorted(df["Month"].unique())]
-    category_options = [{"label": c, "value": c} for c in sorted(df["Category"].unique())]
-    
-    filtered_df = df.copy()
-    
-    if selected_months:
-        filtered_df = filtered_df[filtered_df["Month"].isin(selected_months)]
-    
-    if selected_categories:
-        filtered_df = filtered_df[filtered_df["Category"].isin(selected_categories)]
+    outputs = build_dashboard_outputs(
+        store_digest(icic_data), filter_key(selected_months), filter_key(selected_categories), icic_data
+    )
+    if is_filter_update("stored-icic-data.data"):
+        return patch_figures(outputs, (0, 1, 2))
+    return outputs
+
+@cache.memoize(args_to_ignore=["icic_data"])
+def build_dashboard_outputs(digest, selected_months, selected_categories, icic_data):
+    # Filter and aggregate in one step: the summaries are slices of the cached
+    # Month x Category cube, so no filtered copy of the rows is materialized
+    monthly_summary, category_summary, monthly_category_summary = summarize_from_cube(
+        icic_data, selected_months, selected_categories
+    )
 
-    if filtered_df.empty:
+    if monthly_summary.empty:
         return (
-            month_options, category_options, {}, {}, {}, [], [],
-            "₹0.00", "₹0.00", "N/A", "₹0.00", "N/A", "₹0.00"
+            empty_figure(DASHBOARD_TREND_LAYOUT), empty_figure(DASHBOARD_PIE_LAYOUT),
+            empty_figure(DASHBOARD_BAR_LAYOUT), 0, None
         )
     
     # KPI Calculations
-    total_expenses = filtered_df["Amount"].sum()
-    monthly_summary = filtered_df.groupby("Month")["Amount"].sum().reset_index()
-    avg_monthly_expense = monthly_summary["Amount"].mean()
-    highest_month = monthly_summary.loc[monthly_summary["Amount"].idxmax()]
-    lowest_month = monthly_summary.loc[monthly_summary["Amount"].idxmin()]
+    month_amounts = monthly_summary["Amount"].to_numpy()
+    total_expenses = month_amounts.sum()
+    avg_monthly_expense = month_amounts.mean()
+    month_names = monthly_summary["Month"].to_numpy()
+    i_hi, i_lo = np.argmax(month_amounts), np.argmin(month_amounts)
+    highest_month_name, highest_month_value = month_names[i_hi], month_amounts[i_hi]
+    lowest_month_name, lowest_month_value = month_names[i_lo], month_amounts[i_lo]
     
     # Charts
     # Monthly Trend Chart
-    trend_chart = px.line(
-        monthly_summary,
-        x="Month",
-        y="Amount",
-        title=f"<span style='color:{CUSTOM_COLOR_PALETTE[0]}'>Monthly Expense Trend</span>",
-        markers=True,
-        color_discrete_sequence=[CUSTOM_COLOR_PALETTE[0]],
-        labels={"Amount": "Amount (₹)", "Month": "Month"},
-        template="plotly_dark",
-    )
-    trend_chart.update_layout(
-        title_x=0.5,
-        plot_bgcolor="rgba(0,0,0,0)",
-        paper_bgcolor="rgba(0,0,0,0)",
-        font=dict(color=CUSTOM_COLOR_PALETTE[0]),
-        yaxis_title="Amount (₹)",
-        xaxis_title="Month",
+    trend_chart = go.Figure(
+        line_trace(monthly_summary["Month"], monthly_summary["Amount"], "Month", "Amount (₹)", CUSTOM_COLOR_PALETTE[0]),
+        layout=DASHBOARD_TREND_LAYOUT,
     )
     
     # Top 10 Expense Categories Pie Chart
-    category_summary = filtered_df.groupby("Category")["Amount"].sum().sort_values(ascending=False).head(10).reset_index()
-    pie_chart = px.pie(
-        category_summary,
-        names="Category",
-        values="Amount",
-        title=f"<span style='color:{CUSTOM_COLOR_PALETTE[1]}'>Top 10 Expense Categories</span>",
-        hole=0.4,
-        color_discrete_sequence=CUSTOM_COLOR_PALETTE,
-        template="plotly_dark",
-    )
-    pie_chart.update_layout(
-        title_x=0.5,
-        plot_bgcolor="rgba(0,0,0,0)",
-        paper_bgcolor="rgba(0,0,0,0)",
-        font=dict(color=CUSTOM_COLOR_PALETTE[0]),
+    top_categories = category_summary.sort_values("Amount", ascending=False).head(10)
+    pie_chart = go.Figure(
+        pie_trace(top_categories["Category"], top_categories["Amount"], "Category", "Amount"),
+        layout=DASHBOARD_PIE_LAYOUT,
     )
 
     # Monthly Expenses by Category Bar Chart
-    monthly_category_summary = filtered_df.groupby(["Month", "Category"])["Amount"].sum().reset_index()
-    bar_chart = px.bar(
-        monthly_category_summary,
-        x="Month",
-        y="Amount",
-        color="Category",
-        title=f"<span style='color:{CUSTOM_COLOR_PALETTE[2]}'>Monthly Expenses Breakdown by Category</span>",
-        barmode="group",
-        color_discrete_sequence=CUSTOM_COLOR_PALETTE,
-        labels={"Amount": "Amount (₹)", "Month": "Month", "Category": "Category"},
-        template="plotly_dark",
+    bar_chart = go.Figure(
+        grouped_bar_traces(monthly_category_summary, "Month", "Amount", "Category", "Amount (₹)"),
+        layout=DASHBOARD_BAR_LAYOUT,
     )
-    bar_chart.update_layout(
-        title_x=0.5,
-        plot_bgcolor="rgba(0,0,0,0)",
-        paper_bgcolor="rgba(0,0,0,0)",
-        font=dict(color=CUSTOM_COLOR_PALETTE[0]),
-        yaxis_title="Amount (₹)",
-        xaxis_title="Month",
-    )
-
-    # Data Table
-    table_data = filtered_df.to_dict('records')
-    table_columns = [{"name": i, "id": i} for i in filtered_df.columns]
 
     return (
-        month_options,
-        category_options,
         trend_chart,
         pie_chart,
         bar_chart,
-        table_data,
-        table_columns,
-        f"₹{total_expenses:,.2f}",
-        f"₹{avg_monthly_expense:,.2f}",
-        f"{highest_month['Month']}",
-        f"₹{highest_month['Amount']:,.2f}",
-        f"{lowest_month['Month']}",
-        f"₹{lowest_month['Amount']:,.2f}"
+        0,
+        amount_kpis(
+            total_expenses, avg_monthly_expense,
+            highest_month_name, highest_month_value, lowest_month_name, lowest_month_value
+        )
     )
 
+@app.callback(
+    [
+        Output("overview-data-table", "data"),
+        Output("overview-data-table", "page_count")
+    ],
+    [
+        Input("stored-icic-data", "data"),
+        Input("month-filter", "value"),
+        Input("category-filter", "value"),
+        Input("overview-data-table", "page_current"),
+        Input("overview-data-table", "page_size")
+    ],
+    # The page callback always resets page_current when the page renders, which
+    # fires this once with the settled filters; an initial call would be wasted.
+    prevent_initial_call=True
+)
+def update_overview_table_page(icic_data, selected_months, selected_categories, page_current, page_size):
+    if not icic_data:
+        return [], 1
+
+    filtered_df = select_rows(icic_data, selected_months, selected_categories)
+    return table_page(filtered_df, page_current, page_size)
+
 # --- Savings Monitor Callbacks ---
 
-@app.callback(
+app.clientside_callback(
+    ClientsideFunction(namespace="dashboard", function_name="filterOutputs"),
     [
         Output("savings-month-filter", "options"),
         Output("savings-category-filter", "options"),
+        Output("savings-data-table", "columns")
+    ],
+    [Input("stored-canara-data", "data")]
+)
+
+app.clientside_callback(
+    ClientsideFunction(namespace="dashboard", function_name="resetFilters"),
+    [
+        Output("savings-month-filter", "value"),
+        Output("savings-category-filter", "value")
+    ],
+    [Input("savings-reset-filters-button", "n_clicks")],
+    [
+        State("savings-month-filter", "value"),
+        State("savings-category-filter", "value")
+    ],
+    prevent_initial_call=True
+)
+
+app.clientside_callback(
+    ClientsideFunction(namespace="dashboard", function_name="savingsKpis"),
+    [
         Output("total-savings-credit-kpi", "children"),
         Output("total-savings-debit-kpi", "children"),
-        Output("net-savings-kpi", "children"),
+        Output("net-savings-kpi", "children")
+    ],
+    [Input("savings-kpis", "data")]
+)
+
+@app.callback(
+    [
+        Output("savings-kpis", "data"),
         Output("savings-monthly-trend-chart", "figure"),
-        Output("savings-category-bar-chart", "figure"),
-        Output("savings-data-table", "data"),
-        Output("savings-data-table", "columns"),
+        Output("savings-category-bar-chart-figure", "data"),
+        Output("savings-data-table", "page_current"),
         Output("savings-goal-output", "children")
     ],
     [
         Input("stored-canara-data", "data"),
         Input("savings-month-filter", "value"),
         Input("savings-category-filter", "value"),
-        Input("savings-reset-filters-button", "n_clicks"),
         Input("calculate-goal-button", "n_clicks")
     ],
     [
@@ -998,120 +1696,101 @@ def update_dashboard(icic_data, selected_months, selected_categories, reset_clic
         State("duration-input", "value")
     ]
 )
-def update_savings_monitor(canara_data, selected_months, selected_categories, reset_clicks, calculate_clicks, target_amount, duration):
+def update_savings_monitor(canara_data, selected_months, selected_categories, calculate_clicks, target_amount, duration):
     if not canara_data:
-        return (
-            [], [], "₹0.00", "₹0.00", "₹0.00", {}, {}, [], [], "Please upload data to begin."
-        )
+        return None, {}, {}, 0, "Please upload data to begin."
 
-    df = pd.DataFrame(canara_data)
-    
-    ctx = dash.callback_context
-    if ctx.triggered and ctx.triggered[0]['prop_id'] == 'savings-reset-filters-button.n_clicks':
-        selected_months = []
-        selected_categories = []
-    
-    month_options = [{"label": m, "value": m} for m in sorted(df["Month"].unique())]
-    category_options = [{"label": c, "value": c} for c in sorted(df["Category"].unique())]
-    
-    filtered_df = df.copy()
+    ctx = callback_context
 
-    if selected_months:
-        filtered_df = filtered_df[filtered_df["Month"].isin(selected_months)]
-    
-    if selected_categories:
-        filtered_df = filtered_df[filtered_df["Category"].isin(selected_categories)]
-        
-    if filtered_df.empty:
+    outputs = build_savings_outputs(
+        store_digest(canara_data), filter_key(selected_months), filter_key(selected_categories), canara_data
+    )
+
+    # Goal Calculator Logic (depends on the button, so it stays out of the cache)
+    goal_output = outputs[-1]
+    if not goal_output and ctx.triggered and ctx.triggered[0]['prop_id'] == 'calculate-goal-button.n_clicks':
+        goal_output = calculate_savings_goal(canara_data, target_amount, duration)
+    if is_filter_update("stored-canara-data.data"):
+        outputs = patch_figures(outputs, (1, 2))
+    return outputs[:-1] + (goal_output,)
+
+@cache.memoize(args_to_ignore=["canara_data"])
+def build_savings_outputs(digest, selected_months, selected_categories, canara_data):
+    # Monthly credit/debit totals are slices of the per-version Credit and Debit
+    # cubes (accumulated in float64), not a groupby over the filtered rows.
+    # The cube's row counts also tell whether anything matched, so the
+    # filtered rows themselves are never materialized here
+    credit_sums, row_counts = slice_cube(canara_data, selected_months, selected_categories, "Credit")
+    if not row_counts.to_numpy().any():
         return (
-            month_options, category_options, "₹0.00", "₹0.00", "₹0.00", {}, {}, [], [], "No data found for the selected filters."
+            None, empty_figure(SAVINGS_TREND_LAYOUT), empty_figure(SAVINGS_BAR_LAYOUT), 0,
+            "No data found for the selected filters."
         )
+    debit_sums, _ = slice_cube(canara_data, selected_months, selected_categories, "Debit")
+    has_rows = row_counts.sum(axis=1) > 0
+    monthly_net_savings = pd.DataFrame({
+        "Total_Credit": credit_sums.sum(axis=1)[has_rows],
+        "Total_Debit": debit_sums.sum(axis=1)[has_rows],
+    }).reset_index()
+    monthly_net_savings['Net_Savings'] = monthly_net_savings['Total_Credit'] - monthly_net_savings['Total_Debit']
 
-    # KPI Calculations
-    total_credit = filtered_df["Credit"].sum()
-    total_debit = filtered_df["Debit"].sum()
+    # KPI Calculations (one column-wise reduction over the monthly totals)
+    total_credit, total_debit = monthly_net_savings[["Total_Credit", "Total_Debit"]].to_numpy().sum(axis=0)
     net_savings = total_credit - total_debit
 
     # Charts
     # Monthly Trend Chart (Net Savings)
-    monthly_net_savings = filtered_df.groupby("Month").agg(
-        Total_Credit=('Credit', 'sum'),
-        Total_Debit=('Debit', 'sum')
-    ).reset_index()
-    monthly_net_savings['Net_Savings'] = monthly_net_savings['Total_Credit'] - monthly_net_savings['Total_Debit']
     
-    trend_chart = px.line(
-        monthly_net_savings,
-        x="Month",
-        y="Net_Savings",
-        title=f"<span style='color:{CUSTOM_COLOR_PALETTE[0]}'>Monthly Net Savings Trend</span>",
-        markers=True,
-        color_discrete_sequence=[CUSTOM_COLOR_PALETTE[0]],
-        labels={"Net_Savings": "Net Savings (₹)", "Month": "Month"},
-        template="plotly_dark",
-    )
-    trend_chart.update_layout(
-        title_x=0.5,
-        plot_bgcolor="rgba(0,0,0,0)",
-        paper_bgcolor="rgba(0,0,0,0)",
-        font=dict(color=CUSTOM_COLOR_PALETTE[0]),
-        yaxis_title="Net Savings (₹)",
-        xaxis_title="Month",
+    trend_chart = go.Figure(
+        line_trace(
+            monthly_net_savings["Month"], monthly_net_savings["Net_Savings"], "Month", "Net Savings (₹)", CUSTOM_COLOR_PALETTE[0]
+        ),
+        layout=SAVINGS_TREND_LAYOUT,
     )
     
     # Savings by Category Bar Chart (Credits)
-    category_summary = filtered_df[filtered_df['Credit'] > 0].groupby('Category')['Credit'].sum().sort_values(ascending=False).reset_index()
-    bar_chart = px.bar(
-        category_summary,
-        x="Category",
-        y="Credit",
-        title=f"<span style='color:{CUSTOM_COLOR_PALETTE[1]}'>Savings by Category</span>",
-        color_discrete_sequence=[CUSTOM_COLOR_PALETTE[1]],
-        labels={"Credit": "Total Savings (₹)", "Category": "Category"},
-        template="plotly_dark",
-    )
-    bar_chart.update_layout(
-        title_x=0.5,
-        plot_bgcolor="rgba(0,0,0,0)",
-        paper_bgcolor="rgba(0,0,0,0)",
-        font=dict(color=CUSTOM_COLOR_PALETTE[0]),
-        yaxis_title="Total Savings (₹)",
-        xaxis_title="Category",
+    credits = load_store_frame(canara_data)["Credit"].to_numpy(dtype="float64")
+    keep = credits > 0
+    rows = select_positions(canara_data, selected_months, selected_categories)
+    if rows is not None:
+        in_selection = np.zeros(len(keep), dtype=bool)
+        in_selection[rows] = True
+        keep &= in_selection
+    credit_categories, credit_sums = category_sums(canara_data, credits, keep)
+    category_summary = pd.DataFrame({"Category": credit_categories, "Credit": credit_sums}).sort_values(
+        "Credit", ascending=False
+    ).reset_index(drop=True)
+    bar_chart = go.Figure(
+        bar_trace(category_summary["Category"], category_summary["Credit"], "Category", "Total Savings (₹)", CUSTOM_COLOR_PALETTE[1]),
+        layout=SAVINGS_BAR_LAYOUT,
     )
 
-    # Data Table
-    table_data = filtered_df.to_dict('records')
-    table_columns = [{"name": i, "id": i} for i in filtered_df.columns]
-
-    # Goal Calculator Logic
-    goal_output = ""
-    if ctx.triggered and ctx.triggered[0]['prop_id'] == 'calculate-goal-button.n_clicks':
-        goal_output = calculate_savings_goal(df, target_amount, duration)
-    
     return (
-        month_options,
-        category_options,
-        f"₹{total_credit:,.2f}",
-        f"₹{total_debit:,.2f}",
-        f"₹{net_savings:,.2f}",
+        {"credit": float(total_credit), "debit": float(total_debit), "net": float(net_savings)},
         trend_chart,
         bar_chart,
-        table_data,
-        table_columns,
-        goal_output
+        0,
+        ""
     )
 
-def calculate_savings_goal(df, target_amount, duration):
-    if df.empty:
+# Historical average monthly net savings from ALL data. It only changes when
+# the data does, so it is computed once per store version: rows are sorted by
+# month and each month's net is summed with np.add.reduceat.
+@cached(LRUCache(maxsize=8), key=store_key, lock=Lock())
+def historical_monthly_net_savings(canara_data):
+    df = load_store_frame(canara_data)
+    months = df["Month"].cat.codes.to_numpy()
+    net = df["Credit"].to_numpy(dtype="float64") - df["Debit"].to_numpy(dtype="float64")
+    order = np.argsort(months, kind="stable")
+    sorted_months = months[order]
+    month_starts = np.flatnonzero(np.r_[True, sorted_months[1:] != sorted_months[:-1]])
+    return np.add.reduceat(net[order], month_starts).mean()
+
+def calculate_savings_goal(canara_data, target_amount, duration):
+    if not canara_data:
         return html.P("No data available to calculate savings goals.", className="text-danger")
 
-    # Calculate historical average monthly net savings from ALL data
-    monthly_net_savings = df.groupby("Month").agg(
-        Total_Credit=('Credit', 'sum'),
-        Total_Debit=('Debit', 'sum')
-    )
-    monthly_net_savings['Net_Savings'] = monthly_net_savings['Total_Credit'] - monthly_net_savings['Total_Debit']
-    historical_avg_monthly_net_savings = monthly_net_savings['Net_Savings'].mean()
+    historical_avg_monthly_net_savings = historical_monthly_net_savings(canara_data)
 
     if target_amount is not None and duration is not None:
         if not (isinstance(target_amount, (int, float)) and target_amount > 0 and
@@ -1162,187 +1841,186 @@ def calculate_savings_goal(df, target_amount, duration):
     
     return html.P("Please enter valid numbers for target amount and/or duration.", className="text-danger")
 
+@app.callback(
+    [
+        Output("savings-data-table", "data"),
+        Output("savings-data-table", "page_count")
+    ],
+    [
+        Input("stored-canara-data", "data"),
+        Input("savings-month-filter", "value"),
+        Input("savings-category-filter", "value"),
+        Input("savings-data-table", "page_current"),
+        Input("savings-data-table", "page_size")
+    ],
+    prevent_initial_call=True
+)
+def update_savings_table_page(canara_data, selected_months, selected_categories, page_current, page_size):
+    if not canara_data:
+        return [], 1
+
+    filtered_df = select_rows(canara_data, selected_months, selected_categories)
+    return table_page(filtered_df, page_current, page_size)
+
 # --- Investments Callbacks ---
 
-@app.callback(
+# Outputs for "no data loaded" and "no rows match the filters"
+INVESTMENTS_EMPTY_STATE = (
+    None, empty_figure(INVESTMENTS_TREND_LAYOUT), empty_figure(INVESTMENTS_PIE_LAYOUT),
+    empty_figure(INVESTMENTS_BAR_LAYOUT), 0
+)
+
+app.clientside_callback(
+    ClientsideFunction(namespace="dashboard", function_name="filterOutputs"),
     [
         Output("investments-month-filter", "options"),
         Output("investments-category-filter", "options"),
+        Output("investments-data-table", "columns")
+    ],
+    [Input("stored-investments-data", "data")]
+)
+
+app.clientside_callback(
+    ClientsideFunction(namespace="dashboard", function_name="resetFilters"),
+    [
+        Output("investments-month-filter", "value"),
+        Output("investments-category-filter", "value")
+    ],
+    [Input("investments-reset-filters-button", "n_clicks")],
+    [
+        State("investments-month-filter", "value"),
+        State("investments-category-filter", "value")
+    ],
+    prevent_initial_call=True
+)
+
+app.clientside_callback(
+    ClientsideFunction(namespace="dashboard", function_name="amountKpis"),
+    [
         Output("total-investments-kpi", "children"),
         Output("avg-monthly-investment-kpi", "children"),
         Output("highest-category-kpi-name", "children"),
         Output("highest-category-kpi-value", "children"),
         Output("lowest-category-kpi-name", "children"),
-        Output("lowest-category-kpi-value", "children"),
-        Output("lic-installments-kpi", "children"),
-        Output("kumaran-installments-kpi", "children"),
-        Output("thangamayil-installments-kpi", "children"),
+        Output("lowest-category-kpi-value", "children")
+    ],
+    [Input("investments-kpis", "data")]
+)
+
+@app.callback(
+    [
+        Output("investments-kpis", "data"),
         Output("investments-monthly-trend-chart", "figure"),
         Output("investments-by-category-pie-chart", "figure"),
-        Output("monthly-investments-by-category-chart", "figure"),
-        Output("investments-data-table", "data"),
-        Output("investments-data-table", "columns")
+        Output("monthly-investments-by-category-chart-figure", "data"),
+        Output("investments-data-table", "page_current")
     ],
     [
         Input("stored-investments-data", "data"),
         Input("investments-month-filter", "value"),
-        Input("investments-category-filter", "value"),
-        Input("investments-reset-filters-button", "n_clicks")
+        Input("investments-category-filter", "value")
     ]
 )
-def update_investments_dashboard(investments_data, selected_months, selected_categories, reset_clicks):
+def update_investments_dashboard(investments_data, selected_months, selected_categories):
     if not investments_data:
-        return (
-            [], [], "₹0.00", "₹0.00", "N/A", "₹0.00", "N/A", "₹0.00", "N/A", "N/A", "N/A", {}, {}, {}, [], []
-        )
-
-    df = pd.DataFrame(investments_data)
-    
-    if reset_clicks > 0:
-        selected_months = []
-        selected_categories = []
-    
-    month_options = [{"label": m, "value": m} for m in sorted(df["Month"].unique())]
-    category_options = [{"label": c, "value": c} for c in sorted(df["Category"].unique())]
-    
-    filtered_df = df.copy()
-    
-    if selected_months:
-        filtered_df = filtered_df[filtered_df["Month"].isin(selected_months)]
-    
-    if selected_categories:
-        filtered_df = filtered_df[filtered_df["Category"].isin(selected_categories)]
+        return INVESTMENTS_EMPTY_STATE
 
-    if filtered_df.empty:
-        return (
-            month_options,
-            category_options,
-            "₹0.00",
-            "₹0.00",
-            "N/A",
-            "₹0.00",
-            "N/A",
-            "₹0.00",
-            "N/A",
-            "N/A",
-            "N/A",
-            {},
-            {},
-            {},
-            [],
-            []
-        )
+    outputs = build_investments_outputs(
+        store_digest(investments_data), filter_key(selected_months), filter_key(selected_categories), investments_data
+    )
+    if is_filter_update("stored-investments-data.data"):
+        return patch_figures(outputs, (1, 2, 3))
+    return outputs
+
+@cache.memoize(args_to_ignore=["investments_data"])
+def build_investments_outputs(digest, selected_months, selected_categories, investments_data):
+    # An empty selection is caught from the cube's row counts alone, before
+    # any summary or figure is built
+    _, row_counts = slice_cube(investments_data, selected_months, selected_categories)
+    if not row_counts.to_numpy().any():
+        return INVESTMENTS_EMPTY_STATE
+
+    # Filter and aggregate in one step: the summaries are slices of the cached
+    # Month x Category cube, so no filtered copy of the rows is materialized
+    monthly_summary, category_summary, monthly_category_summary = summarize_from_cube(
+        investments_data, selected_months, selected_categories
+    )
 
     # KPI Calculations
-    total_investments = filtered_df["Amount"].sum()
-    monthly_summary = filtered_df.groupby("Month")["Amount"].sum().reset_index()
-    avg_monthly_investment = monthly_summary["Amount"].mean()
-    category_summary = filtered_df.groupby("Category")["Amount"].sum().reset_index()
-    highest_category = category_summary.loc[category_summary["Amount"].idxmax()]
-    lowest_category = category_summary.loc[category_summary["Amount"].idxmin()]
+    # Plain NumPy reductions over the summary arrays; no pandas row lookups
+    month_amounts = monthly_summary["Amount"].to_numpy()
+    total_investments = month_amounts.sum()
+    avg_monthly_investment = month_amounts.mean()
+    category_amounts = category_summary["Amount"].to_numpy()
+    category_names = category_summary["Category"].to_numpy()
+    i_hi, i_lo = np.argmax(category_amounts), np.argmin(category_amounts)
+    highest_category_name, highest_category_value = category_names[i_hi], category_amounts[i_hi]
+    lowest_category_name, lowest_category_value = category_names[i_lo], category_amounts[i_lo]
     
-    # Installment KPIs
-    # Assuming 'LIC' is the category name for LIC payments
-    lic_investments = df[df['Category'] == 'LIC']
-    lic_installments_paid = lic_investments.shape[0]
-    total_lic_installments = 12 * 25 # Assuming 25 year policy, 12 payments a year
-    lic_installments_left = total_lic_installments - lic_installments_paid
-
-    kumaran_investments = df[df['Category'] == 'KUMARAN']
-    kumaran_installments_paid = kumaran_investments.shape[0]
-    total_kumaran_installments = 100
-    kumaran_installments_left = total_kumaran_installments - kumaran_installments_paid
-
-    thangamayil_investments = df[df['Category'] == 'THANGAMAYIL']
-    thangamayil_installments_paid = thangamayil_investments.shape[0]
-    total_thangamayil_installments = 100
-    thangamayil_installments_left = total_thangamayil_installments - thangamayil_installments_paid
-
     # Charts
     # Monthly Trend Chart
-    trend_chart = px.line(
-        monthly_summary,
-        x="Month",
-        y="Amount",
-        title=f"<span style='color:{CUSTOM_COLOR_PALETTE[0]}'>Monthly Investments Trend</span>",
-        markers=True,
-        color_discrete_sequence=[CUSTOM_COLOR_PALETTE[0]],
-        labels={"Amount": "Amount (₹)", "Month": "Month"},
-        template="plotly_dark",
-    )
-    trend_chart.update_layout(
-        title_x=0.5,
-        plot_bgcolor="rgba(0,0,0,0)",
-        paper_bgcolor="rgba(0,0,0,0)",
-        font=dict(color=CUSTOM_COLOR_PALETTE[0]),
-        yaxis_title="Amount (₹)",
-        xaxis_title="Month",
+    trend_chart = go.Figure(
+        line_trace(monthly_summary["Month"], monthly_summary["Amount"], "Month", "Amount (₹)", CUSTOM_COLOR_PALETTE[0]),
+        layout=INVESTMENTS_TREND_LAYOUT,
     )
-    
+
     # Investments by Category Pie Chart
-    pie_chart = px.pie(
-        category_summary,
-        names="Category",
-        values="Amount",
-        title=f"<span style='color:{CUSTOM_COLOR_PALETTE[1]}'>Investments by Category</span>",
-        hole=0.4,
-        color_discrete_sequence=CUSTOM_COLOR_PALETTE,
-        template="plotly_dark",
-    )
-    pie_chart.update_layout(
-        title_x=0.5,
-        plot_bgcolor="rgba(0,0,0,0)",
-        paper_bgcolor="rgba(0,0,0,0)",
-        font=dict(color=CUSTOM_COLOR_PALETTE[0]),
+    pie_chart = go.Figure(
+        pie_trace(category_summary["Category"], category_summary["Amount"], "Category", "Amount"),
+        layout=INVESTMENTS_PIE_LAYOUT,
     )
 
     # Monthly Investments by Category Bar Chart
-    monthly_category_summary = filtered_df.groupby(["Month", "Category"])["Amount"].sum().reset_index()
-    bar_chart = px.bar(
-        monthly_category_summary,
-        x="Month",
-        y="Amount",
-        color="Category",
-        title=f"<span style='color:{CUSTOM_COLOR_PALETTE[2]}'>Monthly Investments Breakdown by Category</span>",
-        barmode="group",
-        color_discrete_sequence=CUSTOM_COLOR_PALETTE,
-        labels={"Amount": "Amount (₹)", "Month": "Month", "Category": "Category"},
-        template="plotly_dark",
+    bar_chart = go.Figure(
+        grouped_bar_traces(monthly_category_summary, "Month", "Amount", "Category", "Amount (₹)"),
+        layout=INVESTMENTS_BAR_LAYOUT,
     )
-    bar_chart.update_layout(
-        title_x=0.5,
-        plot_bgcolor="rgba(0,0,0,0)",
-        paper_bgcolor="rgba(0,0,0,0)",
-        font=dict(color=CUSTOM_COLOR_PALETTE[0]),
-        yaxis_title="Amount (₹)",
-        xaxis_title="Month",
-    )
-
-    # Data Table
-    table_data = filtered_df.to_dict('records')
-    table_columns = [{"name": i, "id": i} for i in filtered_df.columns]
 
     return (
-        month_options,
-        category_options,
-        f"₹{total_investments:,.2f}",
-        f"₹{avg_monthly_investment:,.2f}",
-        f"{highest_category['Category']}",
-        f"₹{highest_category['Amount']:,.2f}",
-        f"{lowest_category['Category']}",
-        f"₹{lowest_category['Amount']:,.2f}",
-        f"{lic_installments_left}",
-        f"{kumaran_installments_left}",
-        f"{thangamayil_installments_left}",
+        amount_kpis(
+            total_investments, avg_monthly_investment,
+            highest_category_name, highest_category_value, lowest_category_name, lowest_category_value
+        ),
         trend_chart,
         pie_chart,
         bar_chart,
-        table_data,
-        table_columns
+        0
     )
 
+@app.callback(
+    [
+        Output("investments-data-table", "data"),
+        Output("investments-data-table", "page_count")
+    ],
+    [
+        Input("stored-investments-data", "data"),
+        Input("investments-month-filter", "value"),
+        Input("investments-category-filter", "value"),
+        Input("investments-data-table", "page_current"),
+        Input("investments-data-table", "page_size")
+    ],
+    prevent_initial_call=True
+)
+def update_investments_table_page(investments_data, selected_months, selected_categories, page_current, page_size):
+    if not investments_data:
+        return [], 1
+
+    filtered_df = select_rows(investments_data, selected_months, selected_categories)
+    return table_page(filtered_df, page_current, page_size)
+
+app.clientside_callback(
+    ClientsideFunction(namespace="dashboard", function_name="installmentKpis"),
+    [
+        Output("lic-installments-kpi", "children"),
+        Output("kumaran-installments-kpi", "children"),
+        Output("thangamayil-installments-kpi", "children")
+    ],
+    [Input("stored-investments-precomp", "data")]
+)
+
 if __name__ == "__main__":
+    # Local/Windows entry point. Deployments run gunicorn with several gthread
+    # workers (see Procfile); waitress serves callbacks from a thread pool here.
     from waitress import serve
     print("Starting the Dashboard ... Loading data from Google Sheets ...")
-    app.run_server(host='0.0.0.0', port=os.environ.get("PORT", 8080))
-    #serve(app.server, host="0.0.0.0", port=os.environ.get("PORT", 8080))
\ No newline at end of file
+    serve(app.server, host="0.0.0.0", port=int(os.environ.get("PORT", 8080)), threads=8)
\ No newline at end of file
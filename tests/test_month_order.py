@@ -0,0 +1,33 @@
+import pandas as pd
+import pytest
+
+from dashboard import categorize_keys, month_order
+
+
+@pytest.mark.parametrize(
+    "labels, expected",
+    [
+        (["2024-03-01", "2024-01-05", "2024-02-03"], ["2024-01-05", "2024-02-03", "2024-03-01"]),
+        (["05/01/2024", "15/04/2024", "10/02/2024", "12/03/2024"], ["05/01/2024", "10/02/2024", "12/03/2024", "15/04/2024"]),
+        (["January", "March", "February"], ["January", "February", "March"]),
+        (["Jan", "Mar", "Feb"], ["Jan", "Feb", "Mar"]),
+        (["March 2024", "January 2024", "February 2024"], ["January 2024", "February 2024", "March 2024"]),
+        (["Mar-2024", "Jan-2025", "Dec-2024"], ["Mar-2024", "Dec-2024", "Jan-2025"]),
+    ],
+)
+def test_month_order_is_chronological(labels, expected):
+    assert month_order(labels) == (expected, True)
+
+
+def test_month_order_falls_back_to_alphabetical():
+    assert month_order(["Bonus", "January", "Arrears"]) == (["Arrears", "Bonus", "January"], False)
+
+
+def test_month_order_empty():
+    assert month_order([]) == ([], False)
+
+
+def test_categorize_keys_orders_month_categories():
+    df = categorize_keys(pd.DataFrame({"Month": ["February", "January"], "Category": ["Rent", "Food"]}))
+    assert list(df["Month"].cat.categories) == ["January", "February"]
+    assert df["Month"].cat.ordered